@@ -39,6 +39,11 @@ class ExavizPoEBaseEntity(CoordinatorEntity):
         self._attr_name = f"{poe_set.upper()} Port {port_number}{name_suffix}"
         self.entity_id = f"{entity_type}.{poe_set}_port{port_number}{suffix}"
 
+        # _get_port_data() result for the coordinator.data it was found in;
+        # every refresh replaces coordinator.data, which invalidates it
+        self._port_data_source: dict[str, Any] | None = None
+        self._port_data: dict[str, Any] | None = None
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information about this PoE switch."""
@@ -55,11 +60,23 @@ class ExavizPoEBaseEntity(CoordinatorEntity):
         return self.coordinator.last_update_success and self.coordinator.data is not None
 
     def _get_port_data(self) -> dict[str, Any] | None:
-        """Get port data from coordinator."""
-        if not self.coordinator.data:
+        """Get port data from coordinator.
+
+        The port list is searched once per refresh; later property reads
+        against the same coordinator.data reuse the result.
+        """
+        data = self.coordinator.data
+        if data is not self._port_data_source:
+            self._port_data = self._find_port_data(data)
+            self._port_data_source = data
+        return self._port_data
+
+    def _find_port_data(self, data: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Search a coordinator snapshot for this entity's port."""
+        if not data:
             return None
             
-        poe_data = self.coordinator.data.get("poe", {})
+        poe_data = data.get("poe", {})
         poe_set_data = poe_data.get(self._poe_set, {})
         ports = poe_set_data.get("ports", [])
         
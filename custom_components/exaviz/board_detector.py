@@ -25,6 +25,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .poe_readers import read_proc_pse
+
 _LOGGER = logging.getLogger(__name__)
 
 # Required Exaviz host packages.  Both are needed on Cruiser and
@@ -34,6 +36,9 @@ _LOGGER = logging.getLogger(__name__)
 # DHCP servers for connected devices).
 REQUIRED_PACKAGES = ("exaviz-dkms", "exaviz-netplan")
 
+# /proc/pse port line id, e.g. "0-3:" (PSE 0, port 3)
+_PSE_PORT_LINE_RE = re.compile(r"(\d+)-\d+:")
+
 
 class BoardType(Enum):
     """Board type enumeration."""
@@ -102,14 +107,14 @@ async def _detect_from_config_txt() -> BoardType | None:
             if stripped.startswith("#"):
                 continue
 
-            if re.match(r"dtoverlay=cruiser-", stripped):
+            if stripped.startswith("dtoverlay=cruiser-"):
                 _LOGGER.info(
                     "Detected Cruiser board via config.txt: %s",
                     stripped.split(",")[0],
                 )
                 return BoardType.CRUISER
 
-            if re.match(r"dtoverlay=interceptor-", stripped):
+            if stripped.startswith("dtoverlay=interceptor-"):
                 _LOGGER.info(
                     "Detected Interceptor board via config.txt: %s",
                     stripped.split(",")[0],
@@ -270,18 +275,9 @@ async def detect_addon_boards() -> list[str]:
             _LOGGER.debug("No add-on PoE boards detected (/proc/pse not found)")
             return []
 
-        # /proc/pse is a streaming file — read a limited number of lines
-        # to avoid blocking.  30 lines is enough for 2 full PSE cycles
-        # (header + 8 ports + summary per PSE × 2).
-        import subprocess
-        result = await asyncio.to_thread(
-            subprocess.run,
-            ["head", "-30", str(pse_file)],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        pse_text = result.stdout
+        # /proc/pse is a streaming file — one bounded read (header plus every
+        # port line) instead of spawning `head`
+        pse_text = await read_proc_pse()
 
         if not pse_text:
             _LOGGER.debug("/proc/pse exists but returned no data")
@@ -291,7 +287,7 @@ async def detect_addon_boards() -> list[str]:
         # Port lines match: "0-3: power-on 0 15.50 ..."  (PSE 0, port 3)
         pse_ids_found: set[int] = set()
         for line in pse_text.splitlines():
-            match = re.match(r"^(\d+)-\d+:", line.strip())
+            match = _PSE_PORT_LINE_RE.match(line.strip())
             if match:
                 pse_ids_found.add(int(match.group(1)))
 
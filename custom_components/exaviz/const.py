@@ -31,6 +31,18 @@ DEFAULT_SWITCH_MODE_DISCOVERY: Final = False
 MIN_TRAFFIC_BYTES: Final = 1000  # Minimum bytes to consider port active
 TCPDUMP_TIMEOUT: Final = 10  # Seconds to wait for packet capture
 BOSCH_PACKET_COUNT: Final = 20  # Number of packets to capture for Bosch detection
+BOSCH_ETHERTYPE: Final = 0x2070  # Bosch proprietary discovery protocol
+BOSCH_NEGATIVE_CACHE_TTL: Final = 600  # Seconds before re-probing a port that was not Bosch
+BOSCH_POSITIVE_CACHE_TTL: Final = 3600  # Seconds before re-confirming a detected Bosch camera
+ESP32_CAPTURE_SECONDS: Final = 3  # ESP32 serial capture window (streams ~1 cycle/s)
+ESP32_IDLE_TIMEOUT: Final = 1.5  # Give up once the UART is silent this long (> 1 cycle)
+PATH_EXISTS_CACHE_TTL: Final = 30.0  # Seconds to trust a /dev or /proc existence check
+IFACE_EXISTS_CACHE_TTL: Final = 5.0  # Interfaces can come and go; re-check sooner
+PORT_READ_CONCURRENCY: Final = 4  # Onboard ports read in parallel per refresh
+ENRICH_CACHE_TTL: Final = 300  # Seconds to reuse a device's vendor/hostname lookup
+PROC_PSE_READ_TIMEOUT: Final = 0.5  # Seconds to wait for /proc/pse to become readable
+PROC_PSE_SNAPSHOT_TTL: Final = 0.5  # Seconds one /proc/pse read serves every port
+NEIGH_DUMP_TIMEOUT: Final = 1.0  # Seconds to wait for the kernel neighbour table
 
 # Switch/bridge-mode device discovery (issue #10)
 # When a poeN interface is enslaved to a bridge (e.g. br0), per-port ARP is
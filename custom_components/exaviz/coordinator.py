@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+import os
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
@@ -21,14 +22,30 @@ from .const import (
     MIN_TRAFFIC_BYTES,
     PLUGIN_VERSION,
 )
-from .poe_readers import read_all_addon_ports, read_all_onboard_ports
+from .poe_readers import (
+    load_arp_table,
+    query_esp32,
+    read_all_addon_ports,
+    read_all_onboard_ports,
+    stop_esp32_monitor,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lines of the ESP32 "info" response; the query ends once all have arrived
+_ESP32_INFO_PREFIXES = frozenset({
+    b"Exaviz PoE monitor version ",
+    b"board model:",
+    b"board version:",
+    b"board serial:",
+})
+
 
 class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching PoE data from local Cruiser/Interceptor board."""
 
+    _THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.board_type: BoardType | None = None
@@ -37,6 +54,7 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
         self.total_poe_ports = 0
         self.system_info: dict[str, str] = {}
         self.entry = entry
+        self._thermal_fd: int | None = None
 
         # Options (set post-setup) win over the value captured at config time.
         interval = entry.options.get(
@@ -48,6 +66,9 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=interval),
+            # Idle boards return the same snapshot poll after poll; only
+            # notify entities when something actually changed
+            always_update=False,
         )
 
     async def async_setup(self) -> bool:
@@ -99,16 +120,23 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
         try:
             poe_data: dict[str, Any] = {}
             
+            # One neighbour-table read shared by every add-on board (and the
+            # onboard ports, when a board has both); onboard-only boards load
+            # it alongside the ESP32 data instead
+            arp_snapshot = await load_arp_table() if self.addon_boards else None
             for idx, pse_id in enumerate(self.addon_boards):
-                port_data = await read_all_addon_ports(pse_id, port_count=8)
-                pse_num = pse_id.replace("pse", "")
+                port_data = await read_all_addon_ports(
+                    pse_id, port_count=8, arp_snapshot=arp_snapshot,
+                )
+                # Interceptor interfaces are poe{pse_num * 8 + port_num}
+                iface_base = int(pse_id.removeprefix("pse")) * 8
                 
                 ports_list = []
                 for port_num, port_status in sorted(port_data.items()):
                     if not port_status.get("available", False):
                         continue
 
-                    interface = f"poe{int(pse_num) * 8 + port_num}"
+                    interface = f"poe{iface_base + port_num}"
                     is_active = self._is_port_active(port_status)
                     connected_device = self._build_device_info(
                         port_status, interface, is_active, "Add-on PoE",
@@ -150,7 +178,7 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
                     CONF_SWITCH_MODE_DISCOVERY, DEFAULT_SWITCH_MODE_DISCOVERY
                 )
                 onboard_data = await read_all_onboard_ports(
-                    self.onboard_ports, switch_mode_discovery
+                    self.onboard_ports, switch_mode_discovery, arp_snapshot
                 )
                 
                 ports_list = []
@@ -213,7 +241,6 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
                     "addon_boards": len(self.addon_boards),
                     "onboard_ports": len(self.onboard_ports),
                 },
-                "last_updated": datetime.now().isoformat(),
             }
             
         except Exception as ex:
@@ -261,6 +288,8 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and clean up resources."""
+        stop_esp32_monitor()
+        self._close_thermal()
         _LOGGER.debug("Coordinator shutdown complete")
 
     @property
@@ -279,20 +308,31 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
     # Live board metrics (read every poll cycle)
     # ------------------------------------------------------------------
 
-    @staticmethod
-    async def _read_board_temperature() -> float | None:
+    async def _read_board_temperature(self) -> float | None:
         """Read CM5 SoC temperature from thermal_zone0.
 
         Returns temperature in degrees Celsius, or None if unavailable.
-        The sysfs file reports millidegrees (e.g. 55100 = 55.1°C).
+        The sysfs file reports millidegrees (e.g. 55100 = 55.1°C). The file
+        is opened once and re-read from offset 0 each poll, which makes
+        sysfs produce a fresh value without another open/close.
         """
-        thermal_path = Path("/sys/class/thermal/thermal_zone0/temp")
         try:
-            raw = await asyncio.to_thread(thermal_path.read_text)
-            return round(int(raw.strip()) / 1000.0, 1)
-        except (OSError, ValueError):
+            if self._thermal_fd is None:
+                self._thermal_fd = os.open(self._THERMAL_PATH, os.O_RDONLY | os.O_CLOEXEC)
+            raw = await asyncio.to_thread(os.pread, self._thermal_fd, 16, 0)
+            return round(int(raw) / 1000.0, 1)
+        except OSError:
+            self._close_thermal()
+            return None
+        except ValueError:
             return None
 
+    def _close_thermal(self) -> None:
+        """Close the thermal_zone0 fd so the next poll reopens it."""
+        if self._thermal_fd is not None:
+            os.close(self._thermal_fd)
+            self._thermal_fd = None
+
     # ------------------------------------------------------------------
     # System info gathering (runs once during setup, not every poll)
     # ------------------------------------------------------------------
@@ -578,37 +618,15 @@ class ExavizDataUpdateCoordinator(DataUpdateCoordinator):
     async def _query_esp32_info(self) -> dict[str, str]:
         """Query the ESP32 for firmware version and board identity.
 
-        Sends the 'info' command to /dev/pse and parses the response.
+        Sends the 'info' command to the ESP32 UART and parses the response.
         Only called once at startup (static info).
         """
         info: dict[str, str] = {}
-        pse_dev = Path("/dev/pse")
-        if not pse_dev.exists():
-            pse_dev = Path("/dev/ttyAMA3")
-        if not pse_dev.exists():
-            return info
-
         try:
-            # Configure serial port
-            stty_proc = await asyncio.create_subprocess_exec(
-                "stty", "-F", str(pse_dev), "115200", "raw", "-echo",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await stty_proc.communicate()
-
-            # Send "info" command and read response (timeout 3s)
-            proc = await asyncio.create_subprocess_exec(
-                "bash", "-c",
-                f"echo 'info' > {pse_dev} && timeout 3 cat {pse_dev}",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            stdout, _ = await proc.communicate()
-            output = stdout.decode(errors="replace")
+            # Send "info" and read the response (at most ESP32_CAPTURE_SECONDS)
+            lines = await query_esp32("info", _ESP32_INFO_PREFIXES)
 
-            for line in output.splitlines():
-                line = line.strip()
+            for line in lines:
                 if line.startswith("Exaviz PoE monitor version "):
                     info["esp32_firmware_version"] = line.split(
                         "version ", 1
@@ -2,12 +2,27 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
 import logging
 import socket
 from typing import Any
 
+try:
+    import aiodns
+except ImportError:  # pragma: no cover - aiodns ships with Home Assistant core
+    aiodns = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# Shared c-ares resolver, created lazily on the running loop. Queries go out as
+# async UDP on the event loop, so reverse lookups never occupy an executor slot.
+_resolver: Any = None
+
+# Caps concurrent getnameinfo threads when many devices are enriched at once, so
+# blocked lookups cannot monopolise HA's shared default executor. The semaphore
+# binds to the running loop on first contended acquire.
+_DNS_SEM = asyncio.Semaphore(16)
+
 # MAC vendor OUI database (first 3 bytes of MAC address)
 # This is a subset of common manufacturers - can be expanded
 MAC_VENDOR_DB = {
@@ -65,6 +80,11 @@ MAC_VENDOR_DB = {
 }
 
 
+# Lookup table with the uppercase-key invariant enforced once at import, so a
+# hand-edited lowercase entry above can never silently miss.
+_OUI_DB: dict[str, str] = {k.upper(): v for k, v in MAC_VENDOR_DB.items()}
+
+
 def get_mac_vendor(mac_address: str) -> str:
     """Look up vendor/manufacturer from MAC address OUI.
     
@@ -80,21 +100,33 @@ def get_mac_vendor(mac_address: str) -> str:
     # Extract OUI (first 3 bytes)
     oui = mac_address[:8].upper()
     
-    vendor = MAC_VENDOR_DB.get(oui)
+    vendor = _OUI_DB.get(oui)
     if vendor:
         return vendor
     
     # Try to match partial OUI patterns
-    for known_oui, manufacturer in MAC_VENDOR_DB.items():
+    for known_oui, manufacturer in _OUI_DB.items():
         if oui.startswith(known_oui[:5]):  # Match first 2 bytes if exact match fails
             return f"{manufacturer} (partial match)"
     
     return "Unknown"
 
 
+def _get_resolver() -> Any:
+    """Return the shared aiodns resolver bound to the running loop."""
+    global _resolver
+    loop = asyncio.get_running_loop()
+    if _resolver is None or _resolver.loop is not loop:
+        _resolver = aiodns.DNSResolver(loop=loop)
+    return _resolver
+
+
 async def get_hostname_from_ip(ip_address: str, timeout: float = 2.0) -> str | None:
     """Perform reverse DNS lookup to get hostname from IP address.
     
+    Uses aiodns (PTR query on the event loop) when available, otherwise
+    falls back to socket.getnameinfo in a worker thread.
+    
     Args:
         ip_address: IP address to look up
         timeout: Timeout in seconds (default 2.0)
@@ -102,15 +134,29 @@ async def get_hostname_from_ip(ip_address: str, timeout: float = 2.0) -> str | N
     Returns:
         Hostname if found, None otherwise
     """
+    if aiodns is not None:
+        try:
+            ptr = ipaddress.ip_address(ip_address).reverse_pointer
+            result = await asyncio.wait_for(
+                _get_resolver().query(ptr, "PTR"), timeout=timeout,
+            )
+            return result.name or None
+        except (aiodns.error.DNSError, ValueError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Failed to resolve hostname for %s: %s", ip_address, ex)
+            return None
+
     try:
         # Run getnameinfo in thread pool to avoid blocking
-        hostname, _ = await asyncio.wait_for(
-            asyncio.to_thread(
-                socket.getnameinfo, (ip_address, 0), socket.NI_NAMEREQD,
-            ),
-            timeout=timeout,
-        )
-        return hostname if hostname and hostname != ip_address else None
+        async with _DNS_SEM:
+            hostname, _ = await asyncio.wait_for(
+                asyncio.to_thread(
+                    socket.getnameinfo, (ip_address, 0), socket.NI_NAMEREQD,
+                ),
+                timeout=timeout,
+            )
+        # NI_NAMEREQD makes getnameinfo raise (EAI_NONAME) rather than echo
+        # the numeric address back when no PTR record exists.
+        return hostname or None
     except (socket.herror, socket.gaierror, asyncio.TimeoutError, OSError) as ex:
         _LOGGER.debug("Failed to resolve hostname for %s: %s", ip_address, ex)
         return None
@@ -14,24 +14,43 @@ Interceptor (Add-on Board):
   - Format: Space-delimited lines
 
 ESP32 Serial Reader:
-  - Implemented: read_cruiser_pse_data() parses ESP32 UART stream
+  - Implemented: _read_all_esp32_data() finds the working UART with a short
+    capture, then keeps it open in a background _Esp32Monitor; refreshes
+    share its latest reports with every port via esp32_data_map
   - Fallback chain: /dev/pse → /dev/ttyAMA3 → network-only
   - Works when ESP32 firmware is running and outputting data
 """
 from __future__ import annotations
 
 import asyncio
+import fcntl
 import logging
+import os
 import re
-import subprocess
+import select
+import socket
+import struct
+import termios
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .const import (
+    ESP32_CAPTURE_SECONDS,
+    ESP32_IDLE_TIMEOUT,
     MIN_TRAFFIC_BYTES,
     TCPDUMP_TIMEOUT,
     BOSCH_PACKET_COUNT,
+    BOSCH_NEGATIVE_CACHE_TTL,
+    BOSCH_POSITIVE_CACHE_TTL,
+    BOSCH_ETHERTYPE,
+    PATH_EXISTS_CACHE_TTL,
+    IFACE_EXISTS_CACHE_TTL,
+    PORT_READ_CONCURRENCY,
+    ENRICH_CACHE_TTL,
+    NEIGH_DUMP_TIMEOUT,
+    PROC_PSE_READ_TIMEOUT,
+    PROC_PSE_SNAPSHOT_TTL,
     POE_CLASS_POWER_ALLOCATION,
     ARP_SCAN_BIN,
     ARP_SCAN_TIMEOUT,
@@ -43,6 +62,71 @@ from .utils import sudo_argv
 
 _LOGGER = logging.getLogger(__name__)
 
+# Line/field patterns, compiled once at import rather than per port per poll.
+_PSE_NUM_RE = re.compile(r"\d+")
+# `ip neigh` entries; .*? skips BusyBox's extra "used X/X/X probes N" fields.
+# The v6 branch needs two colons, so a MAC-like token is never taken as IPv6.
+_NEIGH_RE = re.compile(
+    r"(?:(?P<v4>\d+\.\d+\.\d+\.\d+)|(?P<v6>[\da-f]*:[\da-f]*:[\da-f:]*))"
+    r"\s+lladdr\s+(?P<mac>[\da-f:]+).*?\b(?P<state>REACHABLE|STALE|DELAY|PROBE)\b",
+    re.IGNORECASE,
+)
+# Preference among usable neighbour states when an interface has several
+_NEIGH_STATE_RANK = {"REACHABLE": 0, "STALE": 1, "DELAY": 2, "PROBE": 3}
+# Common Bosch camera model patterns, tried in order
+_BOSCH_SIGNATURES = (b"Bosch", b"FLEXIDOME", b"DINION", b"AUTODOME")
+# Bosch model prefixes in priority order. One alternation finds every prefix in
+# a single pass; the model text is the printable run starting at the best hit.
+_BOSCH_MODEL_PREFIXES = ("FLEXIDOME", "DINION", "AUTODOME", "MIC", "NBN")
+_BOSCH_MODEL_RANK = {prefix: rank for rank, prefix in enumerate(_BOSCH_MODEL_PREFIXES)}
+_BOSCH_MODEL_RE = re.compile("|".join(_BOSCH_MODEL_PREFIXES), re.IGNORECASE)
+_BOSCH_MODEL_TEXT_RE = re.compile(r"[\x20-\x7E]*")
+# Bridge FDB / arp-scan parsing (switch-mode discovery)
+_MAC_RE = re.compile(r"^[0-9a-f]{2}(?::[0-9a-f]{2}){5}$", re.IGNORECASE)
+_ARP_SCAN_LINE_RE = re.compile(
+    r"^(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f]{2}(?::[0-9a-f]{2}){5})\s*(.*)$",
+    re.IGNORECASE,
+)
+_ARP_SCAN_DUP_RE = re.compile(r"\s*\(DUP:\s*\d+\)\s*$")
+# _parse_field patterns, compiled on first use
+_FIELD_PATTERNS: dict[str, re.Pattern[str]] = {}
+
+
+# Existence of device/proc/sysfs paths: {path: (expiry monotonic time, exists)}.
+# These almost never change, so one stat() per TTL replaces one per port per poll.
+_path_exists_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _cached_exists(path: Path, ttl: float = PATH_EXISTS_CACHE_TTL) -> bool:
+    """Return path.exists(), reusing the answer for up to ttl seconds."""
+    key = str(path)
+    now = time.monotonic()
+    cached = _path_exists_cache.get(key)
+    if cached and now < cached[0]:
+        return cached[1]
+    exists = path.exists()
+    _path_exists_cache[key] = (now + ttl, exists)
+    return exists
+
+
+def _split_port_line(line: str) -> tuple[int, int, list[str]] | None:
+    """Split a "{pse}-{port}: field ..." line from /proc/pse or the ESP32.
+
+    Both formats are strictly whitespace-delimited, so str.split does the
+    work of the former per-line regex.
+
+    Returns:
+        (pse_num, port_num, fields after the port id), or None if the line
+        is not a port line with at least six fields
+    """
+    parts = line.split()
+    if len(parts) < 7 or not parts[0].endswith(":"):
+        return None
+    pse_str, sep, port_str = parts[0][:-1].partition("-")
+    if not (sep and pse_str.isdecimal() and port_str.isdecimal()):
+        return None
+    return int(pse_str), int(port_str), parts[1:]
+
 
 def _unavailable_port(**overrides: Any) -> dict[str, Any]:
     """Return a default unavailable port status dict."""
@@ -60,6 +144,52 @@ def _unavailable_port(**overrides: Any) -> dict[str, Any]:
     return result
 
 
+def _read_proc_pse_bounded() -> str:
+    """Read one bounded snapshot of /proc/pse (blocking; run in a thread).
+
+    /proc/pse is a streaming procfs file, so a plain read-to-EOF can hang.
+    A single 8 KiB read captures the header plus every port line in one
+    syscall, which is also what procfs needs for a consistent snapshot.
+    If the driver has nothing ready within PROC_PSE_READ_TIMEOUT, returns "".
+    """
+    fd = os.open("/proc/pse", os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        readable, _, _ = select.select([fd], [], [], PROC_PSE_READ_TIMEOUT)
+        if not readable:
+            return ""
+        data = os.read(fd, 8192)
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", "ignore")
+
+
+# Last /proc/pse snapshot as (monotonic time read, text). Every port of every
+# add-on board is read within one refresh, so they share a single read.
+_proc_pse_snapshot: tuple[float, str] | None = None
+_proc_pse_lock: asyncio.Lock | None = None
+
+
+async def read_proc_pse() -> str:
+    """Return a /proc/pse snapshot no older than PROC_PSE_SNAPSHOT_TTL.
+
+    Concurrent callers wait for one read instead of each issuing their own.
+    An empty read (driver not ready) is reused too, like any other result.
+
+    Raises:
+        OSError: /proc/pse could not be opened or read
+    """
+    global _proc_pse_snapshot, _proc_pse_lock
+    if _proc_pse_lock is None:
+        _proc_pse_lock = asyncio.Lock()
+    async with _proc_pse_lock:
+        cached = _proc_pse_snapshot
+        if cached and (time.monotonic() - cached[0]) < PROC_PSE_SNAPSHOT_TTL:
+            return cached[1]
+        pse_text = await asyncio.to_thread(_read_proc_pse_bounded)
+        _proc_pse_snapshot = (time.monotonic(), pse_text)
+        return pse_text
+
+
 def get_allocated_power_watts(poe_class: str) -> float:
     """Get allocated power in watts based on PoE class.
     
@@ -69,7 +199,7 @@ def get_allocated_power_watts(poe_class: str) -> float:
     Returns:
         Allocated power in watts
     """
-    return POE_CLASS_POWER_ALLOCATION.get(str(poe_class), 15.4)
+    return POE_CLASS_POWER_ALLOCATION.get(poe_class, 15.4)
 
 
 async def read_pse_port_status(pse_id: str, port_num: int) -> dict[str, Any]:
@@ -93,87 +223,109 @@ async def read_pse_port_status(pse_id: str, port_num: int) -> dict[str, Any]:
     Returns:
         Dictionary with port status information
     """
-    pse_file = Path("/proc/pse")
+    pse_num_match = _PSE_NUM_RE.search(pse_id)
+    pse_num = int(pse_num_match.group()) if pse_num_match else 0
+    return (await _read_proc_pse_ports(pse_num, (port_num,)))[port_num]
+
+
+def _proc_pse_port_status(fields: list[str]) -> dict[str, Any]:
+    """Build an add-on port status from the fields after "{pse}-{port}:".
+
+    Raises:
+        ValueError, IndexError: malformed port line
+    """
+    state, poe_class, power_budget_str, voltage_str, current_str, temp_str = fields[:6]
     
+    voltage_volts = float(voltage_str) if voltage_str != '?' else 0.0
+    
+    # Parse "current/limit" format
+    current_parts = current_str.split('/')
+    current_amps = float(current_parts[0]) if current_parts else 0.0
+    current_milliamps = int(current_amps * 1000)
+    
+    # CRITICAL: The "power" field from /proc/pse is the PSE power
+    # BUDGET (classification result), NOT actual measured consumption.
+    # The IP808AR chip does not have a power measurement register.
+    # Actual power must be computed from V × I.
+    #   Example: power_budget=15.50 (Class 0 allocation), but
+    #            V×I = 48.25 × 0.097 = 4.69W (actual draw).
+    power_watts = round(voltage_volts * current_amps, 2)
+    
+    # Parse "temp/max" format
+    temp_parts = temp_str.split('/')
+    temperature_celsius = float(temp_parts[0]) if temp_parts else 0.0
+    
+    allocated_power = get_allocated_power_watts(poe_class)
+    
+    return {
+        "available": True,
+        "poe_system": "addon",
+        "state": state,
+        "class": poe_class,
+        "power_watts": power_watts,
+        "allocated_power_watts": allocated_power,
+        "voltage_volts": round(voltage_volts, 2),
+        "current_milliamps": current_milliamps,
+        "temperature_celsius": round(temperature_celsius, 1),
+        "enabled": state not in ("disabled",),  # backoff/detecting are ENABLED states
+    }
+
+
+async def _read_proc_pse_ports(pse_num: int, port_nums: Iterable[int]) -> dict[int, dict[str, Any]]:
+    """Read the given ports of one PSE from a single /proc/pse snapshot.
+
+    The snapshot is read once and scanned once for every requested port,
+    rather than once per port.
+
+    Returns:
+        Dictionary mapping port number to port status
+    """
+    port_nums = tuple(port_nums)
     try:
-        if not pse_file.exists():
+        if not _cached_exists(Path("/proc/pse")):
             _LOGGER.debug("/proc/pse not found")
-            return _unavailable_port()
+            return {port_num: _unavailable_port() for port_num in port_nums}
         
-        pse_num_match = re.search(r'\d+', pse_id)
-        pse_num = int(pse_num_match.group()) if pse_num_match else 0
-        
-        # /proc/pse is a streaming file — read limited lines to avoid hang
+        # /proc/pse is a streaming file — one bounded read to avoid hang,
+        # shared by all ports read in the same refresh
+        pse_text = await read_proc_pse()
+    except OSError as e:
+        _LOGGER.error("Failed to read /proc/pse: %s", e)
+        return {
+            port_num: {"available": False, "state": "error", "error": str(e)}
+            for port_num in port_nums
+        }
+    
+    # Format: "0-0: power-on 0 15.50 47.9375 0.05950/0.80000 33.1250/150.0000"
+    # Header, other PSEs and per-PSE summary lines fail the prefix check
+    # before any split; the first line for a port wins.
+    wanted = set(port_nums)
+    found: dict[int, dict[str, Any]] = {}
+    prefix = f"{pse_num}-"
+    for line in pse_text.split('\n'):
+        line = line.lstrip()
+        if not line.startswith(prefix):
+            continue
+        split = _split_port_line(line)
+        if not split or split[1] not in wanted:
+            continue
+        port_num = split[1]
+        wanted.discard(port_num)
         try:
-            result = await asyncio.to_thread(
-                subprocess.run,
-                ['head', '-30', str(pse_file)],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            pse_text = result.stdout
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-            _LOGGER.error("Failed to read /proc/pse: %s", e)
-            return {
-                "available": False,
-                "state": "error",
-                "error": str(e),
-            }
-        
-        # Format: "0-0: power-on 0 15.50 47.9375 0.05950/0.80000 33.1250/150.0000"
-        port_pattern = rf'^{pse_num}-{port_num}:\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)'
-        
-        for line in pse_text.split('\n'):
-            match = re.match(port_pattern, line.strip())
-            if match:
-                state, poe_class, power_budget_str, voltage_str, current_str, temp_str = match.groups()
-                
-                voltage_volts = float(voltage_str) if voltage_str != '?' else 0.0
-                
-                # Parse "current/limit" format
-                current_parts = current_str.split('/')
-                current_amps = float(current_parts[0]) if current_parts else 0.0
-                current_milliamps = int(current_amps * 1000)
-                
-                # CRITICAL: The "power" field from /proc/pse is the PSE power
-                # BUDGET (classification result), NOT actual measured consumption.
-                # The IP808AR chip does not have a power measurement register.
-                # Actual power must be computed from V × I.
-                #   Example: power_budget=15.50 (Class 0 allocation), but
-                #            V×I = 48.25 × 0.097 = 4.69W (actual draw).
-                power_watts = round(voltage_volts * current_amps, 2)
-                
-                # Parse "temp/max" format
-                temp_parts = temp_str.split('/')
-                temperature_celsius = float(temp_parts[0]) if temp_parts else 0.0
-                
-                allocated_power = get_allocated_power_watts(poe_class)
-                
-                return {
-                    "available": True,
-                    "poe_system": "addon",
-                    "state": state,
-                    "class": poe_class,
-                    "power_watts": power_watts,
-                    "allocated_power_watts": allocated_power,
-                    "voltage_volts": round(voltage_volts, 2),
-                    "current_milliamps": current_milliamps,
-                    "temperature_celsius": round(temperature_celsius, 1),
-                    "enabled": state not in ("disabled",),  # backoff/detecting are ENABLED states
-                }
-        
+            found[port_num] = _proc_pse_port_status(split[2])
+        except (ValueError, IndexError) as ex:
+            _LOGGER.error("Failed to parse PSE port %d-%d: %s", pse_num, port_num, ex)
+            found[port_num] = {"available": False, "state": "error", "error": str(ex)}
+        if not wanted:
+            break
+    
+    for port_num in wanted:
         # Port not found in output
         _LOGGER.warning("Port %d-%d not found in /proc/pse", pse_num, port_num)
-        return _unavailable_port()
-        
-    except Exception as ex:
-        _LOGGER.error("Failed to read PSE port status %s/port%d: %s", pse_id, port_num, ex)
-        return {
-            "available": False,
-            "state": "error",
-            "error": str(ex),
-        }
+    return {
+        port_num: found[port_num] if port_num in found else _unavailable_port()
+        for port_num in port_nums
+    }
 
 
 def _parse_esp32_line(line: str) -> dict[str, Any] | None:
@@ -193,14 +345,23 @@ def _parse_esp32_line(line: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with parsed data or None if not a port line
     """
-    # Match port line: "0-0: power-on 3 15 48.500 325/800 35.2 error_msg"
-    port_pattern = r'^(\d+)-(\d+):\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)/(\S+)\s+(\S+)\s*(.*)$'
-    match = re.match(port_pattern, line.strip())
-    
-    if not match:
+    # Port line: "0-0: power-on 3 15 48.500 325/800 35.2 error_msg"
+    # ESP32 ids are always one digit each, so check the "d-d:" shape by offset
+    # and read the ids from it; per-PSE summary lines fail here. The error
+    # text is the unsplit remainder after the six fixed fields.
+    line = line.strip()
+    if len(line) < 4 or line[1] != "-" or line[3] != ":" or not (line[0].isdigit() and line[2].isdigit()):
+        return None
+    fields = line[4:].split(None, 6)
+    if len(fields) < 6:
         return None
     
-    pse_num, port_num, state, poe_class, power_str, voltage_str, current_str, limit_str, temp_str, error = match.groups()
+    pse_num, port_num = int(line[0]), int(line[2])
+    state, poe_class, power_str, voltage_str, current_limit, temp_str = fields[:6]
+    current_str, slash, limit_str = current_limit.rpartition('/')
+    if not slash:
+        return None
+    error = fields[6] if len(fields) > 6 else ""
     
     try:
         voltage_volts = float(voltage_str) if voltage_str != '?' else 0.0
@@ -215,12 +376,9 @@ def _parse_esp32_line(line: str) -> dict[str, Any] | None:
         allocated_power = get_allocated_power_watts(poe_class)
 
         # Return RAW ESP32 coordinates — conversion to Linux port numbers happens at lookup time
-        pse_num_int = int(pse_num)
-        port_num_int = int(port_num)
-        
         return {
-            "pse_num": pse_num_int,  # ESP32 PSE number (0 or 1)
-            "port_num": port_num_int,  # ESP32 port number (0-3)
+            "pse_num": pse_num,  # ESP32 PSE number (0 or 1)
+            "port_num": port_num,  # ESP32 port number (0-3)
             "available": True,
             "poe_system": "onboard",
             "state": state,
@@ -231,176 +389,131 @@ def _parse_esp32_line(line: str) -> dict[str, Any] | None:
             "current_milliamps": current_milliamps,
             "temperature_celsius": round(temperature_celsius, 1),
             "enabled": state not in ("disabled",),
-            "error": error.strip() if error else "",
+            "error": error,
         }
     except (ValueError, IndexError) as ex:
         _LOGGER.debug("Failed to parse ESP32 line '%s': %s", line, ex)
         return None
 
 
-async def _read_esp32_serial_stream(pse_num: int, port_num: int) -> dict[str, Any] | None:
-    """Read ESP32 PoE monitor serial stream from /dev/pse or /dev/ttyAMA3.
-    
-    Reads the serial stream for ~3 seconds to capture multiple update cycles.
-    The ESP32 outputs port data approximately once per second, so we need
-    to read long enough to catch at least one full cycle.
-    
-    Args:
-        pse_num: PSE controller number (0 or 1)
-        port_num: Port number (0-7)
-        
-    Returns:
-        Dictionary with PoE metrics or None if not found
-    """
-    # Try both /dev/pse (udev symlink) and /dev/ttyAMA3 (direct UART)
-    for device_path in [Path("/dev/pse"), Path("/dev/ttyAMA3")]:
-        if not device_path.exists():
-            continue
-        
-        try:
-            _LOGGER.debug("Reading ESP32 stream from %s for PSE %d port %d", device_path, pse_num, port_num)
-            
-            # CRITICAL: ESP32 outputs at 115200 baud, must set before reading
-            # Note: udev rule 60-pse.rules also sets this, but be explicit
-            stty_proc = await asyncio.create_subprocess_exec(
-                "stty", "-F", str(device_path), "115200", "raw", "-echo",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await stty_proc.communicate()
-            
-            # Read serial stream for 3 seconds to capture multiple update cycles
-            # ESP32 outputs all ports once per second, so 3 seconds ensures we catch data
-            proc = await asyncio.create_subprocess_exec(
-                "timeout", "3", "cat", str(device_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.DEVNULL
-            )
-            
-            stdout, _ = await proc.communicate()
-            
-            # Take the most recent occurrence (last in the stream)
-            target_port_id = f"{pse_num}-{port_num}:"
-            last_match = None
-            for line in stdout.decode('utf-8', errors='ignore').split('\n'):
-                if target_port_id in line:
-                    parsed = _parse_esp32_line(line)
-                    if parsed and parsed["pse_num"] == pse_num and parsed["port_num"] == port_num:
-                        last_match = parsed  # Keep the most recent match
-            
-            if last_match:
-                _LOGGER.debug("Found ESP32 data for port %s: %s", target_port_id, last_match)
-                return last_match
-            
-            _LOGGER.debug("No ESP32 data found for %s in stream from %s", target_port_id, device_path)
-            
-        except Exception as ex:
-            _LOGGER.debug("Failed to read ESP32 stream from %s: %s", device_path, ex)
-            continue
-    
-    return None
+# Cruiser port ids as the ESP32 prints them: PSE 0/1, ports 0-3 each
+_ESP32_PORT_IDS = frozenset(
+    f"{pse}-{port}:".encode() for pse in (0, 1) for port in range(4)
+)
 
 
-async def _try_read_cruiser_pse_data(port_num: int) -> dict[str, Any] | None:
-    """Try to read power data from Cruiser's ESP32 serial stream.
-    
-    CRITICAL ARCHITECTURE:
-    - Cruiser: TPS23861 → ESP32-C6 (I2C) → CM5 (UART3) → /dev/ttyAMA3
-    - Data format: Text lines from ESP32 firmware
-    - ESP32 firmware reads TPS23861 and streams formatted data over UART
-    
-    ESP32 Protocol Format:
-      "{pse}-{port}: {state} {class} {power} {voltage} {current}/{limit} {temp} {error}"
-      Example: "0-0: power-on 3 15 48.500 325/800 35.2 "
-    
-    Args:
-        port_num: Port number (0-7)
-    
-    Returns:
-        Dictionary with power data if available, None if ESP32 not running
-    """
-    # CRITICAL: Hardware PSE-to-Port Mapping
-    # Physical layout (looking at back of board):
-    #   P1  P3  P5  P7
-    #   P2  P4  P6  P8
-    #
-    # PSE Mapping:
-    #   PSE 1 (left side)  → P1-P4 → Linux poe0-3
-    #   PSE 0 (right side) → P5-P8 → Linux poe4-7
-    #
-    # Conversion: Linux port 0-7 → ESP32 PSE-port
-    pse_num = 1 if port_num < 4 else 0  # Ports 0-3 use PSE1, ports 4-7 use PSE0
-    pse_port_num = port_num % 4  # Local port number on PSE controller
-    
-    esp32_data = await _read_esp32_serial_stream(pse_num, pse_port_num)
-    if esp32_data:
-        return esp32_data
-    
-    # ESP32 not running or no data - return None
-    # The caller will fall back to network-only data
-    _LOGGER.debug("ESP32 data not available for port %d (PSE %d, local port %d)", 
-                  port_num, pse_num, pse_port_num)
-    return None
+# Linux poeN port number → the ESP32's (pse_num, port_num), indexed by N.
+#
+# CRITICAL: Hardware PSE-to-Port Mapping
+# Physical layout (looking at back of board):
+#   P1  P3  P5  P7
+#   P2  P4  P6  P8
+#
+# PSE Mapping:
+#   PSE 1 (left side)  → P1-P4 → Linux poe0-3
+#   PSE 0 (right side) → P5-P8 → Linux poe4-7
+_ESP32_PORT_KEYS: tuple[tuple[int, int], ...] = tuple(
+    (1 if port_num < 4 else 0, port_num % 4) for port_num in range(8)
+)
 
 
-async def _read_link_state(sys_net_path: Path) -> tuple[str, bool, int]:
-    """Read link state, admin state, and speed from sysfs.
+def _esp32_port_ids(interfaces: list[str]) -> frozenset[bytes]:
+    """ESP32 line ids ("{pse}-{port}:") for the given poeN interfaces."""
+    ids = set()
+    for interface in interfaces:
+        suffix = interface.removeprefix("poe")
+        if suffix.isdecimal() and int(suffix) < len(_ESP32_PORT_KEYS):
+            pse_num, port_num = _ESP32_PORT_KEYS[int(suffix)]
+            ids.add(f"{pse_num}-{port_num}:".encode())
+    return frozenset(ids)
 
-    Returns:
-        (link_state, admin_up, speed_mbps)
+
+# sysfs attributes read for each onboard port, in _read_iface_sysfs order
+_IFACE_SYSFS_FILES = (
+    "operstate", "flags", "speed", "statistics/rx_bytes", "statistics/tx_bytes",
+)
+
+
+def _read_iface_sysfs(
+    sys_net_path: Path, names: tuple[str, ...] = _IFACE_SYSFS_FILES,
+) -> tuple[str | None, ...]:
+    """Read per-port sysfs attributes in one pass (blocking; run in a thread).
+
+    Each attribute is a few bytes, so one small os.read per file suffices.
+    Returns the stripped text per file in `names` order, or None where the
+    file is missing/unreadable (e.g. speed on a down link).
     """
+    values: list[str | None] = []
+    for name in names:
+        try:
+            fd = os.open(sys_net_path / name, os.O_RDONLY)
+            try:
+                values.append(os.read(fd, 128).decode("ascii", "ignore").strip())
+            finally:
+                os.close(fd)
+        except OSError:
+            values.append(None)
+    return tuple(values)
+
+
+def _parse_link_state(
+    operstate: str | None, flags_hex: str | None, speed_text: str | None,
+) -> tuple[str, bool, int]:
+    """Derive (link_state, admin_up, speed_mbps) from raw sysfs values."""
     # Operational state
-    link_state = "unknown"
-    operstate_file = sys_net_path / "operstate"
-    if operstate_file.exists():
-        link_state = (await asyncio.to_thread(operstate_file.read_text)).strip()
+    link_state = operstate or "unknown"
 
     # Administrative state (IFF_UP flag)
     admin_up = False
-    flags_file = sys_net_path / "flags"
-    if flags_file.exists():
+    if flags_hex is not None:
         try:
-            flags_hex = (await asyncio.to_thread(flags_file.read_text)).strip()
             admin_up = bool(int(flags_hex, 16) & 0x1)
-        except (ValueError, OSError):
+        except ValueError:
             admin_up = link_state in ("up", "lowerlayerdown")
 
     # Speed (only meaningful when link is up)
     speed_mbps = 0
-    if link_state == "up":
-        speed_file = sys_net_path / "speed"
-        if speed_file.exists():
-            try:
-                speed_mbps = int((await asyncio.to_thread(speed_file.read_text)).strip())
-            except (ValueError, OSError):
-                pass
+    if link_state == "up" and speed_text is not None:
+        try:
+            speed_mbps = int(speed_text)
+        except ValueError:
+            pass
 
     return link_state, admin_up, speed_mbps
 
 
-async def _read_traffic_stats(sys_net_path: Path) -> tuple[int, int]:
-    """Read rx_bytes and tx_bytes from sysfs statistics.
+def _parse_traffic_stats(rx_text: str | None, tx_text: str | None) -> tuple[int, int]:
+    """Derive (rx_bytes, tx_bytes) from raw sysfs values."""
+    counters = []
+    for text in (rx_text, tx_text):
+        try:
+            counters.append(int(text) if text is not None else 0)
+        except ValueError:
+            counters.append(0)
+    return counters[0], counters[1]
 
-    Returns:
-        (rx_bytes, tx_bytes)
+
+def _read_net_dev() -> dict[str, tuple[int, int]]:
+    """Read (rx_bytes, tx_bytes) for every interface from /proc/net/dev.
+
+    One read per refresh replaces two statistics files per port. Blocking;
+    run in a thread.
     """
-    stats_path = sys_net_path / "statistics"
-    rx_bytes = tx_bytes = 0
-    if not stats_path.exists():
-        return rx_bytes, tx_bytes
-
-    for name, attr in [("rx_bytes", "rx_bytes"), ("tx_bytes", "tx_bytes")]:
-        f = stats_path / name
-        if f.exists():
-            try:
-                val = int((await asyncio.to_thread(f.read_text)).strip())
-                if attr == "rx_bytes":
-                    rx_bytes = val
-                else:
-                    tx_bytes = val
-            except (ValueError, OSError):
-                pass
-    return rx_bytes, tx_bytes
+    with open("/proc/net/dev", "rb") as net_dev:
+        data = net_dev.read()
+    stats: dict[str, tuple[int, int]] = {}
+    # Two header lines, then "  iface: rx_bytes packets ... (8 rx fields) tx_bytes ..."
+    for line in data.split(b"\n")[2:]:
+        name, sep, fields = line.partition(b":")
+        values = fields.split()
+        if not sep or len(values) < 9:
+            continue
+        stats[name.strip().decode("ascii", "ignore")] = (int(values[0]), int(values[8]))
+    return stats
+
+
+# Last (rx_bytes, tx_bytes) seen per interface, for _try_bosch_detection
+_last_traffic_seen: dict[str, tuple[int, int]] = {}
 
 
 async def _try_bosch_detection(
@@ -411,21 +524,43 @@ async def _try_bosch_detection(
     connected_device: dict[str, Any] | None,
 ) -> dict[str, Any] | None:
     """Detect Bosch camera via tcpdump if ARP is missing or manufacturer unknown."""
-    should_try = False
-    if not connected_device and link_state == "up" and (rx_bytes > MIN_TRAFFIC_BYTES or tx_bytes > MIN_TRAFFIC_BYTES):
-        _LOGGER.debug("No ARP for %s, traffic detected (%d RX, %d TX) — trying Bosch detection",
-                       interface, rx_bytes, tx_bytes)
-        should_try = True
-    elif connected_device and connected_device.get("manufacturer") == "Unknown" and link_state == "up":
-        _LOGGER.debug("Unknown manufacturer for %s — trying Bosch detection", interface)
-        should_try = True
-
-    if not should_try:
-        return connected_device
-
-    bosch_info = await _detect_bosch_camera(interface)
-    if not bosch_info:
-        return connected_device
+    # Counters only grow, so gate on traffic since the previous poll; a quiet
+    # link is probed once when traffic first appears rather than every refresh.
+    prev_rx, prev_tx = _last_traffic_seen.get(interface, (0, 0))
+    _last_traffic_seen[interface] = (rx_bytes, tx_bytes)
+    if rx_bytes < prev_rx or tx_bytes < prev_tx:
+        prev_rx = prev_tx = 0  # counters reset (interface re-created)
+        _forget_bosch(interface)
+    if link_state != "up":
+        _forget_bosch(interface)  # whatever comes back may be another device
+    delta_rx, delta_tx = rx_bytes - prev_rx, tx_bytes - prev_tx
+
+    mac_address = connected_device.get("mac_address") if connected_device else None
+    # A camera already identified on this port is reported from the cache even
+    # on a quiet poll; the traffic gate only decides whether to start a capture.
+    cached = _bosch_cache.get(_bosch_cache_key(interface, mac_address))
+    bosch_info: dict[str, str] | None
+    if link_state == "up" and cached and cached[1] and time.monotonic() < cached[0]:
+        bosch_info = cached[1]
+    else:
+        should_try = False
+        if not connected_device and link_state == "up" and (delta_rx > MIN_TRAFFIC_BYTES or delta_tx > MIN_TRAFFIC_BYTES):
+            _LOGGER.debug("No ARP for %s, new traffic detected (%d RX, %d TX) — trying Bosch detection",
+                           interface, delta_rx, delta_tx)
+            should_try = True
+        elif connected_device and connected_device.get("manufacturer") == "Unknown" and link_state == "up":
+            _LOGGER.debug("Unknown manufacturer for %s — trying Bosch detection", interface)
+            should_try = True
+        elif cached and cached[1] and link_state == "up":
+            _LOGGER.debug("Bosch detection on %s expired — re-confirming", interface)
+            should_try = True
+
+        if not should_try:
+            return connected_device
+
+        bosch_info = await _detect_bosch_camera(interface, mac_address)
+        if not bosch_info:
+            return connected_device
 
     bosch_fields = {
         "name": f"{bosch_info['model']} on {interface}",
@@ -453,36 +588,44 @@ async def _get_bridge_master(interface: str) -> str | None:
     the bridge netdev. Its basename is the bridge name (e.g. "br0"). Absence of
     the symlink means the port is not in switch/bridge mode.
     """
-    master = Path(f"/sys/class/net/{interface}/master")
-    if not master.exists():
-        return None
+    # One readlink, no exists() probe: a missing link is the common case and
+    # is answered by the same syscall (FileNotFoundError).
     try:
-        return (await asyncio.to_thread(master.resolve)).name
+        return os.path.basename(os.readlink(f"/sys/class/net/{interface}/master"))
     except OSError:
         return None
 
 
-async def _collect_local_macs() -> set[str]:
-    """Collect this host's own interface MACs (to exclude from FDB matches)."""
+def _read_local_macs() -> set[str]:
+    """Read every interface's sysfs address (blocking; run in a thread).
+
+    One scandir plus one small os.read per interface, so the whole set costs
+    a single thread-pool hop.
+    """
     macs: set[str] = set()
-    net = Path("/sys/class/net")
-    if not net.exists():
-        return macs
     try:
-        entries = await asyncio.to_thread(lambda: list(net.iterdir()))
+        entries = list(os.scandir("/sys/class/net"))
     except OSError:
         return macs
-    for iface in entries:
-        addr = iface / "address"
+    for entry in entries:
         try:
-            mac = (await asyncio.to_thread(addr.read_text)).strip().lower()
-            if mac:
-                macs.add(mac)
+            fd = os.open(f"{entry.path}/address", os.O_RDONLY)
+            try:
+                mac = os.read(fd, 64).decode("ascii", "ignore").strip().lower()
+            finally:
+                os.close(fd)
         except OSError:
-            pass
+            continue
+        if mac:
+            macs.add(mac)
     return macs
 
 
+async def _collect_local_macs() -> set[str]:
+    """Collect this host's own interface MACs (to exclude from FDB matches)."""
+    return await asyncio.to_thread(_read_local_macs)
+
+
 def _is_multicast_mac(mac: str) -> bool:
     """True for multicast/broadcast MACs (least-significant bit of first octet)."""
     try:
@@ -503,13 +646,12 @@ def _parse_bridge_fdb(output: str, own_macs: set[str]) -> list[str]:
     remains is the MAC(s) of the device(s) behind the port.
     """
     macs: list[str] = []
-    mac_re = re.compile(r"^[0-9a-f]{2}(?::[0-9a-f]{2}){5}$", re.IGNORECASE)
     for line in output.splitlines():
         parts = line.split()
         if not parts:
             continue
         mac = parts[0].lower()
-        if not mac_re.match(mac):
+        if not _MAC_RE.match(mac):
             continue
         if "self" in parts or "permanent" in parts:
             continue
@@ -545,16 +687,12 @@ def _parse_arp_scan(output: str) -> dict[str, dict[str, str]]:
     Each result line is tab/space separated: ``<ip>\\t<mac>\\t<vendor>``.
     """
     result: dict[str, dict[str, str]] = {}
-    line_re = re.compile(
-        r"^(\d+\.\d+\.\d+\.\d+)\s+([0-9a-f]{2}(?::[0-9a-f]{2}){5})\s*(.*)$",
-        re.IGNORECASE,
-    )
     for line in output.splitlines():
-        m = line_re.match(line.strip())
+        m = _ARP_SCAN_LINE_RE.match(line.strip())
         if m:
             vendor = m.group(3).strip()
             # arp-scan appends "(DUP: N)" to duplicate responses; drop it.
-            vendor = re.sub(r"\s*\(DUP:\s*\d+\)\s*$", "", vendor).strip()
+            vendor = _ARP_SCAN_DUP_RE.sub("", vendor).strip()
             # arp-scan prints "(Unknown)" / "(Unknown: locally administered)"
             # when it cannot name the OUI; treat that as no vendor so it never
             # clobbers our built-in lookup.
@@ -633,7 +771,7 @@ async def _do_arp_scan(bridge: str) -> dict[str, dict[str, str]]:
     ]
     # Ubuntu 26.04's arp-scan can't find its default OUI db; point it at the
     # packaged file so the vendor column resolves. Skip if absent.
-    if Path(ARP_SCAN_OUI_FILE).exists():
+    if _cached_exists(Path(ARP_SCAN_OUI_FILE)):
         cmd.append(f"--ouifile={ARP_SCAN_OUI_FILE}")
 
     proc = None
@@ -781,39 +919,57 @@ def _build_onboard_result(
     }
 
 
-async def read_network_port_status(interface: str, esp32_data_map: dict[tuple[int, int], dict[str, Any]] | None = None, switch_mode_discovery: bool = False) -> dict[str, Any]:
+async def read_network_port_status(interface: str, esp32_data_map: dict[tuple[int, int], dict[str, Any]] | None = None, switch_mode_discovery: bool = False, arp_snapshot: dict[str, str] | None = None, traffic_snapshot: dict[str, tuple[int, int]] | None = None) -> dict[str, Any]:
     """Read onboard PoE network interface status (Cruiser Carrier Board).
 
-    Reads real power data from /dev/pse* (ESP32/TPS23861) when available,
+    Uses real power data from the ESP32/TPS23861 capture when available,
     falls back to network-only data with mocked power metrics.
 
     Args:
         interface: Network interface name (e.g., "poe0")
-        esp32_data_map: Pre-read ESP32 data keyed by (pse_num, port_num)
+        esp32_data_map: ESP32 data keyed by (pse_num, port_num), captured once
+            per refresh by _read_all_esp32_data(); None means no power data
+        switch_mode_discovery: resolve bridge-member ports via FDB + arp-scan
+        arp_snapshot: Neighbour table from load_arp_table(); None loads
+            a fresh one
+        traffic_snapshot: Byte counters from _read_net_dev(); interfaces not
+            in it fall back to their sysfs statistics files
 
     Returns:
         Dictionary with port status information
     """
     try:
         sys_net_path = Path(f"/sys/class/net/{interface}")
-        if not sys_net_path.exists():
+        if not _cached_exists(sys_net_path, IFACE_EXISTS_CACHE_TTL):
             return {"available": False, "state": "unavailable", "link_state": "down"}
 
         port_num = int(interface.replace("poe", ""))
 
-        # Resolve ESP32 power data
+        # Resolve ESP32 power data from the shared per-cycle capture
         real_power_data = None
-        if esp32_data_map is not None:
-            # PSE mapping: PSE 1 (left) = ports 0-3, PSE 0 (right) = ports 4-7
-            pse_num = 1 if port_num < 4 else 0
-            real_power_data = esp32_data_map.get((pse_num, port_num % 4))
-        else:
-            real_power_data = await _try_read_cruiser_pse_data(port_num)
+        if esp32_data_map is not None and port_num < len(_ESP32_PORT_KEYS):
+            real_power_data = esp32_data_map.get(_ESP32_PORT_KEYS[port_num])
 
-        link_state, admin_up, speed_mbps = await _read_link_state(sys_net_path)
-        rx_bytes, tx_bytes = await _read_traffic_stats(sys_net_path)
+        counters = traffic_snapshot.get(interface) if traffic_snapshot else None
+        if counters is not None:
+            operstate, flags_hex, speed_text = await asyncio.to_thread(
+                _read_iface_sysfs, sys_net_path, _IFACE_SYSFS_FILES[:3],
+            )
+            rx_bytes, tx_bytes = counters
+        else:
+            operstate, flags_hex, speed_text, rx_text, tx_text = await asyncio.to_thread(
+                _read_iface_sysfs, sys_net_path,
+            )
+            rx_bytes, tx_bytes = _parse_traffic_stats(rx_text, tx_text)
+        link_state, admin_up, speed_mbps = _parse_link_state(
+            operstate, flags_hex, speed_text,
+        )
 
-        connected_device = await _get_connected_device_from_arp(interface)
+        # A down link has no live neighbour; a leftover STALE entry would only
+        # show a device that is no longer there
+        connected_device = None
+        if link_state == "up":
+            connected_device = await _get_connected_device_from_arp(interface, arp_snapshot)
         # Switch/bridge mode: per-port ARP is empty, resolve via bridge FDB +
         # arp-scan before the (slower) proprietary-protocol tcpdump fallback.
         connected_device = await _resolve_bridged_device(
@@ -838,28 +994,188 @@ async def read_network_port_status(interface: str, esp32_data_map: dict[tuple[in
         return {"available": False, "state": "error", "error": str(ex)}
 
 
-async def _get_connected_device_from_arp(interface: str) -> dict[str, str] | None:
-    """Get connected device information from ARP table with enrichment.
-    
-    Args:
-        interface: Network interface name
-    
+# Manufacturer/hostname per (MAC, IP): {key: (expiry monotonic time, fields)}.
+# The OUI is fixed per MAC; the TTL only bounds how stale a PTR name can get.
+_enrich_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+
+
+async def _enrich_device_info_cached(device_info: dict[str, Any]) -> dict[str, Any]:
+    """enrich_device_info(), reusing the lookups for a recently seen device.
+
+    Always returns a new dict, since callers update it in place.
+    """
+    key = (device_info["mac_address"].lower(), device_info["ip_address"])
+    now = time.monotonic()
+    cached = _enrich_cache.get(key)
+    if cached and now < cached[0]:
+        return {**device_info, **cached[1]}
+
+    enriched = await enrich_device_info(device_info)
+    # A MAC seen at a new IP replaces its old entry
+    for stale in [k for k in _enrich_cache if k[0] == key[0] and k != key]:
+        del _enrich_cache[stale]
+    _enrich_cache[key] = (
+        now + ENRICH_CACHE_TTL,
+        {k: v for k, v in enriched.items() if k not in device_info},
+    )
+    return enriched
+
+
+# rtnetlink neighbour dump (linux/netlink.h, linux/rtnetlink.h, linux/neighbour.h)
+_NLMSG_HDR = struct.Struct("=IHHII")  # len, type, flags, seq, pid
+_NDMSG = struct.Struct("=BxxxiHBB")  # family, ifindex, state, flags, type
+_RTATTR = struct.Struct("=HH")  # len, type
+_NLMSG_ERROR = 2
+_NLMSG_DONE = 3
+_RTM_NEWNEIGH = 28
+_RTM_GETNEIGH = 30
+_NLM_F_REQUEST_DUMP = 0x301  # NLM_F_REQUEST | NLM_F_DUMP
+_NDA_DST = 1
+_NDA_LLADDR = 2
+_NUD_STATE_NAMES = {
+    0x01: "INCOMPLETE", 0x02: "REACHABLE", 0x04: "STALE", 0x08: "DELAY",
+    0x10: "PROBE", 0x20: "FAILED",
+}
+_NUD_HIDDEN = 0x40 | 0x80  # NUD_NOARP | NUD_PERMANENT
+
+
+def _neigh_entry(
+    data: bytes, body: int, end: int, names: dict[int, str]
+) -> tuple[str, str] | None:
+    """Render one RTM_NEWNEIGH message as (interface, `ip neigh` line)."""
+    family, ifindex, state, _, _ = _NDMSG.unpack_from(data, body)
+    interface = names.get(ifindex)
+    if interface is None or state & _NUD_HIDDEN:
+        # `ip neigh show` leaves NOARP/PERMANENT entries out by default too
+        return None
+    dst = lladdr = None
+    attr = body + _NDMSG.size
+    while attr + _RTATTR.size <= end:
+        attr_len, attr_type = _RTATTR.unpack_from(data, attr)
+        if attr_len < _RTATTR.size:
+            break
+        if attr_type == _NDA_DST:
+            dst = data[attr + _RTATTR.size:attr + attr_len]
+        elif attr_type == _NDA_LLADDR:
+            lladdr = data[attr + _RTATTR.size:attr + attr_len]
+        attr += (attr_len + 3) & ~3
+    if dst is None:
+        return None
+    fields = [socket.inet_ntop(family, dst)]
+    if lladdr:
+        fields += ["lladdr", lladdr.hex(":")]
+    fields.append(_NUD_STATE_NAMES.get(state, "NONE"))
+    return interface, " ".join(fields)
+
+
+def _parse_neigh_messages(
+    data: bytes, names: dict[int, str], table: dict[str, list[str]]
+) -> bool:
+    """Add the neighbour entries in one netlink read to table.
+
+    Entries are rendered as `ip neigh show dev <iface>` prints them, so
+    _NEIGH_RE handles both sources. Returns True once NLMSG_DONE is seen.
+    """
+    offset = 0
+    while offset + _NLMSG_HDR.size <= len(data):
+        length, msg_type, _, _, _ = _NLMSG_HDR.unpack_from(data, offset)
+        if length < _NLMSG_HDR.size or offset + length > len(data):
+            raise OSError("truncated netlink message")
+        body = offset + _NLMSG_HDR.size
+        if msg_type == _NLMSG_DONE:
+            return True
+        if msg_type == _NLMSG_ERROR:
+            error = -struct.unpack_from("=i", data, body)[0]
+            if error:
+                raise OSError(error, os.strerror(error))
+        elif msg_type == _RTM_NEWNEIGH:
+            if entry := _neigh_entry(data, body, offset + length, names):
+                table.setdefault(entry[0], []).append(entry[1])
+        offset += (length + 3) & ~3
+    return False
+
+
+def _dump_neighbours() -> dict[str, str]:
+    """Read the whole kernel neighbour table over rtnetlink (blocking).
+
+    One socket round trip, no process spawn. Raises OSError if netlink is
+    unavailable so the caller can fall back to `ip neigh show`.
+    """
+    names = dict(socket.if_nameindex())
+    request = _NLMSG_HDR.pack(
+        _NLMSG_HDR.size + _NDMSG.size, _RTM_GETNEIGH, _NLM_F_REQUEST_DUMP, 1, 0
+    ) + _NDMSG.pack(socket.AF_UNSPEC, 0, 0, 0, 0)
+    table: dict[str, list[str]] = {}
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE) as sock:
+        sock.settimeout(NEIGH_DUMP_TIMEOUT)
+        sock.sendall(request)
+        while not _parse_neigh_messages(sock.recv(65536), names, table):
+            pass
+    return {interface: "\n".join(lines) for interface, lines in table.items()}
+
+
+async def load_arp_table() -> dict[str, str]:
+    """Snapshot the whole neighbour table in one netlink dump.
+
+    Falls back to a single `ip neigh show` if netlink is not usable. Either
+    way it is one query per refresh instead of one per interface.
+    /proc/net/arp is not used because it has neither IPv6 entries nor the
+    NUD state.
+
     Returns:
-        Dictionary with device IP, MAC, manufacturer, and hostname (if available)
+        Mapping of interface name to its `ip neigh show dev <iface>` output
+        (the "dev <iface>" field stripped), empty if the table is unavailable
     """
     try:
-        # Run: ip neigh show dev poe0
+        return await asyncio.to_thread(_dump_neighbours)
+    except OSError as ex:
+        _LOGGER.debug("Netlink neighbour dump failed, using ip neigh: %s", ex)
+
+    try:
         proc = await asyncio.create_subprocess_exec(
-            "ip", "neigh", "show", "dev", interface,
+            "ip", "neigh", "show",
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
         stdout, _ = await proc.communicate()
-        
         if proc.returncode != 0:
-            return None
-        
-        output = stdout.decode().strip()
+            return {}
+    except Exception as ex:
+        _LOGGER.debug("Failed to read neighbour table: %s", ex)
+        return {}
+
+    table: dict[str, list[str]] = {}
+    for line in stdout.decode().splitlines():
+        fields = line.split()
+        try:
+            dev_idx = fields.index("dev")
+        except ValueError:
+            continue
+        if dev_idx + 1 >= len(fields):
+            continue
+        interface = fields[dev_idx + 1]
+        del fields[dev_idx:dev_idx + 2]
+        table.setdefault(interface, []).append(" ".join(fields))
+    return {interface: "\n".join(lines) for interface, lines in table.items()}
+
+
+async def _get_connected_device_from_arp(
+    interface: str, arp_snapshot: dict[str, str] | None = None
+) -> dict[str, str] | None:
+    """Get connected device information from ARP table with enrichment.
+    
+    Args:
+        interface: Network interface name
+        arp_snapshot: Neighbour table from load_arp_table(); None loads
+            a fresh one
+    
+    Returns:
+        Dictionary with device IP, MAC, manufacturer, and hostname (if available)
+    """
+    try:
+        if arp_snapshot is None:
+            arp_snapshot = await load_arp_table()
+        output = arp_snapshot.get(interface, "")
         if not output:
             return None
         
@@ -872,62 +1188,27 @@ async def _get_connected_device_from_arp(interface: str) -> dict[str, str] | Non
         # ("used X/X/X probes N") between the MAC address and the NUD state.
         # We use .*? to skip any intermediate fields.
         
-        # Try IPv4 first
-        ipv4_match = re.search(r"(\d+\.\d+\.\d+\.\d+)\s+lladdr\s+([\da-f:]+).*?\b(REACHABLE|STALE|DELAY|PROBE)\b", output, re.IGNORECASE)
-        if ipv4_match:
+        # One pass over the entries; IPv4 wins over IPv6 as before, then
+        # the freshest NUD state (e.g. a REACHABLE entry over a STALE one)
+        neigh_match = None
+        best_rank = None
+        for match in _NEIGH_RE.finditer(output):
+            rank = (match["v4"] is None, _NEIGH_STATE_RANK[match["state"].upper()])
+            if best_rank is None or rank < best_rank:
+                neigh_match, best_rank = match, rank
+                if rank == (False, 0):
+                    break
+        
+        if neigh_match:
             device_info = {
-                "ip_address": ipv4_match.group(1),
-                "mac_address": ipv4_match.group(2),
-                "arp_state": ipv4_match.group(3).upper(),
+                "ip_address": neigh_match["v4"] or neigh_match["v6"],
+                "mac_address": neigh_match["mac"],
+                "arp_state": neigh_match["state"].upper(),
             }
             
             # Enrich with manufacturer and hostname
-            enriched_info = await enrich_device_info(device_info)
-            
-            # VCS Video Communication Systems is used by Bosch cameras
-            # Verify if this VCS device is actually a Bosch camera via tcpdump
-            manufacturer = enriched_info.get("manufacturer", "") if enriched_info else ""
-            if manufacturer.startswith("VCS Video Communication Systems"):
-                _LOGGER.debug("VCS device detected on %s, checking if it's a Bosch camera", interface)
-                bosch_info = await _detect_bosch_camera(interface)
-                if bosch_info:
-                    _LOGGER.info("Confirmed VCS device on %s is a Bosch camera: %s", interface, bosch_info.get("model", "Unknown"))
-                    # Replace VCS with Bosch in manufacturer field
-                    enriched_info["manufacturer"] = "Bosch"
-                    enriched_info["model"] = bosch_info.get("model", "Camera")
-            
-            return enriched_info
-        
-        # Try IPv6 (neighbor discovery) — also handles BusyBox extra fields
-        ipv6_match = re.search(r"([\da-f:]+)\s+lladdr\s+([\da-f:]+).*?\b(REACHABLE|STALE|DELAY|PROBE)\b", output, re.IGNORECASE)
-        if ipv6_match:
-            ipv6_addr = ipv6_match.group(1)
-            mac_addr = ipv6_match.group(2)
-            
-            # Validate it's actually IPv6 (contains multiple colons, not a MAC)
-            if ipv6_addr.count(':') >= 2:
-                device_info = {
-                    "ip_address": ipv6_addr,
-                    "mac_address": mac_addr,
-                    "arp_state": ipv6_match.group(3).upper(),
-                }
-                
-                # Enrich with manufacturer and hostname
-                enriched_info = await enrich_device_info(device_info)
-                
-                # VCS Video Communication Systems is used by Bosch cameras
-                # Verify if this VCS device is actually a Bosch camera via tcpdump
-                manufacturer = enriched_info.get("manufacturer", "") if enriched_info else ""
-                if manufacturer.startswith("VCS Video Communication Systems"):
-                    _LOGGER.debug("VCS device detected on %s, checking if it's a Bosch camera", interface)
-                    bosch_info = await _detect_bosch_camera(interface)
-                    if bosch_info:
-                        _LOGGER.info("Confirmed VCS device on %s is a Bosch camera: %s", interface, bosch_info.get("model", "Unknown"))
-                        # Replace VCS with Bosch in manufacturer field
-                        enriched_info["manufacturer"] = "Bosch"
-                        enriched_info["model"] = bosch_info.get("model", "Camera")
-                
-                return enriched_info
+            enriched_info = await _enrich_device_info_cached(device_info)
+            return await _maybe_upgrade_vcs_to_bosch(enriched_info, interface)
         
         return None
         
@@ -936,11 +1217,138 @@ async def _get_connected_device_from_arp(interface: str) -> dict[str, str] | Non
         return None
 
 
-async def _detect_bosch_camera(interface: str) -> dict[str, str] | None:
+async def _maybe_upgrade_vcs_to_bosch(
+    enriched_info: dict[str, Any], interface: str
+) -> dict[str, Any]:
+    """Relabel a VCS-OUI device as Bosch if the port carries Bosch discovery.
+
+    VCS Video Communication Systems MACs are used by Bosch cameras, but
+    the OUI alone does not prove it, so confirm with a (cached) capture.
+    """
+    manufacturer = enriched_info.get("manufacturer") or ""
+    if not manufacturer.startswith("VCS Video Communication Systems"):
+        return enriched_info
+
+    _LOGGER.debug("VCS device detected on %s, checking if it's a Bosch camera", interface)
+    bosch_info = await _detect_bosch_camera(interface, enriched_info.get("mac_address"))
+    if bosch_info:
+        _LOGGER.info("Confirmed VCS device on %s is a Bosch camera: %s", interface, bosch_info.get("model", "Unknown"))
+        enriched_info["manufacturer"] = "Bosch"
+        enriched_info["model"] = bosch_info.get("model", "Camera")
+    return enriched_info
+
+
+# Bosch probe results keyed by (interface, MAC): (expiry monotonic time, result).
+# Negatives expire after BOSCH_NEGATIVE_CACHE_TTL and positives after
+# BOSCH_POSITIVE_CACHE_TTL. An interface's entries are dropped early when a
+# different MAC shows up, the link goes down, or its byte counters reset.
+_bosch_cache: dict[tuple[str, str | None], tuple[float, dict[str, str] | None]] = {}
+
+
+def _bosch_cache_key(interface: str, mac_address: str | None) -> tuple[str, str | None]:
+    """Cache key for a Bosch probe; ARP MACs may arrive in either case."""
+    return (interface, mac_address.lower() if mac_address else None)
+
+
+def _forget_bosch(interface: str) -> None:
+    """Drop every cached Bosch probe result for an interface."""
+    for key in [k for k in _bosch_cache if k[0] == interface]:
+        del _bosch_cache[key]
+
+
+async def _detect_bosch_camera(
+    interface: str, mac_address: str | None = None
+) -> dict[str, str] | None:
+    """Detect Bosch camera, reusing a cached result for the same device.
+    
+    The packet capture takes up to TCPDUMP_TIMEOUT seconds, so it is only
+    repeated once a negative result expires or the MAC on the port changes.
+    
+    Args:
+        interface: Network interface name
+        mac_address: MAC of the device on the port, if known from ARP
+    
+    Returns:
+        Dictionary with manufacturer and model info, or None if not Bosch
+    """
+    key = _bosch_cache_key(interface, mac_address)
+    cached = _bosch_cache.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    result = await _capture_bosch_camera(interface)
+
+    # A new MAC on this interface means a different device; forget the old one
+    for stale in [k for k in _bosch_cache if k[0] == interface and k != key]:
+        del _bosch_cache[stale]
+    ttl = BOSCH_POSITIVE_CACHE_TTL if result else BOSCH_NEGATIVE_CACHE_TTL
+    expiry = time.monotonic() + ttl
+    _bosch_cache[key] = (expiry, result)
+    return result
+
+
+def _read_bosch_frames(interface: str) -> bytes:
+    """Collect Bosch discovery frames from a raw AF_PACKET socket.
+
+    The kernel only delivers frames with ethertype 0x2070, so no user-space
+    filtering is needed. Stops at the first frame carrying a Bosch signature,
+    after BOSCH_PACKET_COUNT frames, or after TCPDUMP_TIMEOUT seconds.
+    Blocking; call via asyncio.to_thread.
+
+    Raises:
+        OSError: Raw sockets unavailable (not root, or no such interface)
+        AttributeError: Platform without AF_PACKET
+    """
+    frames: list[bytes] = []
+    deadline = time.monotonic() + TCPDUMP_TIMEOUT
+    with socket.socket(
+        socket.AF_PACKET, socket.SOCK_RAW, socket.htons(BOSCH_ETHERTYPE)
+    ) as sock:
+        # bind() takes the protocol in host byte order, socket() in network order
+        sock.bind((interface, BOSCH_ETHERTYPE))
+        while len(frames) < BOSCH_PACKET_COUNT:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(remaining)
+            try:
+                frame = sock.recv(2048)
+            except TimeoutError:
+                break
+            frames.append(frame)
+            if any(sig in frame for sig in _BOSCH_SIGNATURES):
+                break
+    return b"\n".join(frames)
+
+
+async def _tcpdump_bosch_output(interface: str) -> bytes | None:
+    """Capture packets with tcpdump when raw sockets are not available."""
+    # tcpdump requires root privileges, so we use sudo (or run directly
+    # when already root, e.g. in an HA container)
+    proc = await asyncio.create_subprocess_exec(
+        *sudo_argv("timeout", str(TCPDUMP_TIMEOUT), "tcpdump"),
+        "-i", interface,
+        "-c", str(BOSCH_PACKET_COUNT),  # Capture packets for detection
+        "-A",  # ASCII payload only; the signatures are plain text
+        "-s", "256",  # Discovery frames are small; cap anything larger
+        "-n",  # Don't resolve names
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, _ = await proc.communicate()
+
+    # timeout returns 124 if it timed out, 0 if tcpdump finished naturally
+    if proc.returncode not in (0, 124):
+        return None
+    return stdout
+
+
+async def _capture_bosch_camera(interface: str) -> dict[str, str] | None:
     """Detect Bosch camera via proprietary protocol packet capture.
     
     Bosch cameras use ethertype 0x2070 and broadcast discovery packets
-    containing manufacturer and model information in plaintext.
+    containing manufacturer and model information in plaintext. Frames are
+    read from a raw socket; tcpdump is only used when that is not permitted.
     
     Args:
         interface: Network interface name
@@ -949,50 +1357,35 @@ async def _detect_bosch_camera(interface: str) -> dict[str, str] | None:
         Dictionary with manufacturer and model info, or None if not Bosch
     """
     try:
-        # Capture a few packets to look for Bosch protocol
-        # tcpdump requires root privileges, so we use sudo (or run directly
-        # when already root, e.g. in an HA container)
-        proc = await asyncio.create_subprocess_exec(
-            *sudo_argv("timeout", str(TCPDUMP_TIMEOUT), "tcpdump"),
-            "-i", interface,
-            "-c", str(BOSCH_PACKET_COUNT),  # Capture packets for detection
-            "-XX",  # Hex dump with ASCII
-            "-n",  # Don't resolve names
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, _ = await proc.communicate()
-        
-        # timeout returns 124 if it timed out, 0 if tcpdump finished naturally
-        if proc.returncode not in (0, 124):
-            return None
-        
-        output = stdout.decode(errors='ignore')
+        payload: bytes | None
+        try:
+            payload = await asyncio.to_thread(_read_bosch_frames, interface)
+        except (OSError, AttributeError) as ex:
+            _LOGGER.debug("Raw capture unavailable on %s (%s), using tcpdump", interface, ex)
+            payload = await _tcpdump_bosch_output(interface)
+            if payload is None:
+                return None
         
-        # Look for Bosch signatures in the capture
-        if 'Bosch' in output or 'FLEXIDOME' in output or 'DINION' in output or 'AUTODOME' in output:
+        # Look for Bosch signatures in the raw bytes; the capture is only
+        # decoded for the model lookup once one is found (the rare case)
+        if any(sig in payload for sig in _BOSCH_SIGNATURES):
+            output = payload.decode("latin-1")
             # Try to extract model name
             model = "Unknown Model"
             manufacturer = "Bosch Security Systems"
             device_type = "Camera"
             
-            # Common Bosch camera model patterns
-            patterns = [
-                r'(FLEXIDOME[^\\n]*)',
-                r'(DINION[^\\n]*)',
-                r'(AUTODOME[^\\n]*)',
-                r'(MIC[^\\n]*)',  # Bosch MIC series
-                r'(NBN[^\\n]*)',  # Bosch NBN series
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, output, re.IGNORECASE)
-                if match:
-                    model = match.group(1).strip()
-                    # Clean up common artifacts
-                    model = re.sub(r'[^\x20-\x7E]+', ' ', model)  # Remove non-printable
-                    model = model.strip()
-                    break
+            best: tuple[int, int] | None = None
+            for match in _BOSCH_MODEL_RE.finditer(output):
+                rank = _BOSCH_MODEL_RANK[match.group().upper()]
+                if best is None or rank < best[0]:
+                    best = (rank, match.start())
+                    if rank == 0:
+                        break
+            if best is not None:
+                model_match = _BOSCH_MODEL_TEXT_RE.match(output, best[1])
+                if model_match:
+                    model = model_match.group().strip()
             
             _LOGGER.info("Detected Bosch camera on %s: %s", interface, model)
             
@@ -1010,21 +1403,27 @@ async def _detect_bosch_camera(interface: str) -> dict[str, str] | None:
         return None
 
 
-def _parse_field(text: str, pattern: str) -> str | None:
+def _parse_field(text: str, pattern: str | re.Pattern[str]) -> str | None:
     """Parse a field from status text using regex.
     
     Args:
         text: Text to parse
-        pattern: Regex pattern with one capture group
+        pattern: Regex (string or compiled) with one capture group; strings
+            are compiled once and kept in _FIELD_PATTERNS
     
     Returns:
         Captured value or None if not found
     """
-    match = re.search(pattern, text)
+    if isinstance(pattern, str):
+        compiled = _FIELD_PATTERNS.get(pattern)
+        if compiled is None:
+            compiled = _FIELD_PATTERNS[pattern] = re.compile(pattern)
+        pattern = compiled
+    match = pattern.search(text)
     return match.group(1).strip() if match else None
 
 
-async def read_all_addon_ports(pse_id: str, port_count: int = 8) -> dict[int, dict[str, Any]]:
+async def read_all_addon_ports(pse_id: str, port_count: int = 8, arp_snapshot: dict[str, str] | None = None) -> dict[int, dict[str, Any]]:
     """Read all ports for an add-on PoE board.
     
     On the Interceptor, the IP179H DSA switch creates network interfaces
@@ -1034,130 +1433,463 @@ async def read_all_addon_ports(pse_id: str, port_count: int = 8) -> dict[int, di
     Args:
         pse_id: PSE controller ID (e.g., "pse0")
         port_count: Number of ports to read (default 8)
+        arp_snapshot: Neighbour table from load_arp_table(), so several
+            boards can share one; read here when not given
     
     Returns:
         Dictionary mapping port number to port status
     """
-    tasks = [
-        read_pse_port_status(pse_id, port_num)
-        for port_num in range(port_count)
-    ]
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    pse_num = int(pse_id.removeprefix("pse"))
+    if arp_snapshot is None:
+        arp_snapshot = await load_arp_table()
     
-    pse_num = int(pse_id.replace("pse", ""))
+    # One /proc/pse read and one pass over it for every port of the board
+    port_data = await _read_proc_pse_ports(pse_num, range(port_count))
     
-    port_data = {}
-    for port_num, result in enumerate(results):
-        if isinstance(result, Exception):
-            _LOGGER.error("Failed to read port %s/%d: %s", pse_id, port_num, result)
-            port_data[port_num] = {
-                "available": False,
-                "state": "error",
-                "error": str(result),
-            }
-        else:
-            # Interceptor interface naming: poe{pse_num * 8 + port_num}
-            # pse0 → poe0-poe7, pse1 → poe8-poe15
-            interface = f"poe{pse_num * 8 + port_num}"
-            
-            port_status = result.copy()
-            if port_status.get("available", False):
-                device_info = await _get_connected_device_from_arp(interface)
-                if device_info:
+    # Same cap as the onboard reader: each port may resolve a hostname
+    sem = asyncio.Semaphore(PORT_READ_CONCURRENCY)
+
+    async def _add_connected_device(port_num: int, port_status: dict[str, Any]) -> None:
+        # Errors are caught per port so one failure never cancels the others
+        async with sem:
+            try:
+                # Interceptor interface naming: poe{pse_num * 8 + port_num}
+                # pse0 → poe0-poe7, pse1 → poe8-poe15
+                interface = f"poe{pse_num * 8 + port_num}"
+                if device_info := await _get_connected_device_from_arp(interface, arp_snapshot):
                     port_status["connected_device"] = device_info
-            
-            port_data[port_num] = port_status
+            except Exception as ex:
+                _LOGGER.error("Failed to read port %s/%d: %s", pse_id, port_num, ex)
+                port_data[port_num] = {"available": False, "state": "error", "error": str(ex)}
+
+    async with asyncio.TaskGroup() as tg:
+        for port_num, port_status in port_data.items():
+            if port_status.get("available"):
+                tg.create_task(_add_connected_device(port_num, port_status))
     
     return port_data
 
 
-async def _read_all_esp32_data() -> dict[tuple[int, int], dict[str, Any]]:
+# UART paths already switched to raw 115200 8N1. Line settings persist on
+# the device after close, so this is done once rather than every refresh.
+_configured_ttys: set[str] = set()
+
+
+def _configure_tty(fd: int) -> None:
+    """Put the ESP32 UART in raw 115200 8N1 mode (`stty 115200 raw -echo`)."""
+    iflag, oflag, cflag, lflag, _, _, cc = termios.tcgetattr(fd)
+    iflag &= ~(
+        termios.IGNBRK | termios.BRKINT | termios.PARMRK | termios.ISTRIP
+        | termios.INLCR | termios.IGNCR | termios.ICRNL | termios.IXON
+    )
+    oflag &= ~termios.OPOST
+    cflag &= ~(termios.CSIZE | termios.PARENB)
+    cflag |= termios.CS8 | termios.CREAD | termios.CLOCAL
+    lflag &= ~(
+        termios.ECHO | termios.ECHONL | termios.ICANON | termios.ISIG
+        | termios.IEXTEN
+    )
+    termios.tcsetattr(fd, termios.TCSANOW, [
+        iflag, oflag, cflag, lflag, termios.B115200, termios.B115200, cc,
+    ])
+    _set_low_latency(fd)
+
+
+# struct serial_struct: `flags` is the fifth int; ASYNC_LOW_LATENCY from
+# <linux/serial.h>. 72 bytes covers the struct on both 32- and 64-bit.
+_SERIAL_STRUCT_SIZE = 72
+_SERIAL_FLAGS_OFFSET = 16
+_ASYNC_LOW_LATENCY = 0x2000
+
+
+def _set_low_latency(fd: int) -> None:
+    """Ask the serial driver to push received bytes to the tty immediately.
+
+    Best effort (`setserial low_latency`): ptys and drivers without
+    TIOCGSERIAL reject the ioctl, and the UART then works as before.
+    """
+    try:
+        serial = bytearray(fcntl.ioctl(fd, termios.TIOCGSERIAL, bytes(_SERIAL_STRUCT_SIZE)))
+        (flags,) = struct.unpack_from("i", serial, _SERIAL_FLAGS_OFFSET)
+        if flags & _ASYNC_LOW_LATENCY:
+            return
+        struct.pack_into("i", serial, _SERIAL_FLAGS_OFFSET, flags | _ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, bytes(serial))
+    except OSError as ex:
+        _LOGGER.debug("low_latency not supported on ESP32 UART: %s", ex)
+
+
+# Longest plausible ESP32 line; a newline-free stream beyond this is garbage
+_ESP32_MAX_LINE = 256
+
+
+def _drain_uart(
+    path: str,
+    duration: float,
+    port_ids: frozenset[bytes] = frozenset(),
+    idle_timeout: float | None = None,
+    command: bytes = b"",
+) -> list[bytes]:
+    """Configure the ESP32 UART and collect its output for `duration` seconds.
+
+    Blocking; run in a thread. Replaces the former `stty` + `timeout cat`
+    subprocess pair with termios (first use of `path` only) and a select()
+    loop on one fd. `command`, if given, is written once the UART is set
+    up, so its response is captured from the start. Lines are
+    split off as chunks arrive; returns early once a complete line has
+    arrived starting with every prefix in `port_ids` (e.g. b"0-1:"), or once
+    the line has been silent for `idle_timeout` seconds.
+
+    A partial line that grows past _ESP32_MAX_LINE without a newline is
+    discarded, so noise on the UART costs linear rather than quadratic time.
+
+    Returns:
+        Complete lines without their b"\\n"; a trailing partial line is dropped
+    """
+    mode = os.O_RDWR if command else os.O_RDONLY
+    fd = os.open(path, mode | os.O_NOCTTY | os.O_NONBLOCK)
+    try:
+        if path not in _configured_ttys:
+            _configure_tty(fd)
+            _configured_ttys.add(path)
+        if command:
+            os.write(fd, command)
+
+        lines: list[bytes] = []
+        pending = set(port_ids)
+        partial = b""
+        deadline = time.monotonic() + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            if idle_timeout is not None:
+                remaining = min(remaining, idle_timeout)
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                break
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                break
+            *complete, partial = (partial + chunk).split(b"\n")
+            if len(partial) > _ESP32_MAX_LINE:
+                partial = b""  # line noise (e.g. baud mismatch), not a port line
+            lines.extend(complete)
+            if pending:
+                for line in complete:
+                    line = line.lstrip()
+                    pending.difference_update([p for p in pending if line.startswith(p)])
+                if not pending:
+                    break
+        return lines
+    finally:
+        os.close(fd)
+
+
+def _parse_esp32_capture(
+    lines: list[bytes], port_ids: frozenset[bytes],
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Parse the most recent report for each of `port_ids` from a capture.
+
+    Lines are matched on their literal 4-byte "{pse}-{port}:" id, so per-PSE
+    summaries ("0: ...") and boot noise are dropped before anything is
+    decoded. Walking newest-first means only the latest good line per port
+    is parsed, however many times the ports reported in the window.
+    """
+    esp32_data: dict[tuple[int, int], dict[str, Any]] = {}
+    wanted = set(port_ids)
+    for raw_line in reversed(lines):
+        if raw_line[:4] not in wanted:
+            continue
+        parsed = _parse_esp32_line(raw_line.decode('ascii', errors='ignore'))
+        if parsed:
+            esp32_data[(parsed["pse_num"], parsed["port_num"])] = parsed
+            wanted.discard(raw_line[:4])
+            if not wanted:
+                break
+    return esp32_data
+
+
+def _capture_esp32(
+    path: str, port_ids: frozenset[bytes],
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Drain the ESP32 UART and parse the capture (blocking; run in a thread).
+
+    Parsing stays off the event loop along with the serial read, so the
+    concurrent per-port tasks are not held up behind it.
+    """
+    lines = _drain_uart(path, ESP32_CAPTURE_SECONDS, port_ids, ESP32_IDLE_TIMEOUT)
+    return _parse_esp32_capture(lines, port_ids)
+
+
+class _Esp32Monitor:
+    """Keep the ESP32 UART open and its latest report per port in memory.
+
+    The fd is registered with the event loop's reader, so the stream is
+    parsed as it arrives (about eight short lines a second) and a refresh
+    reads the result instead of capturing a window of its own.
+    """
+
+    def __init__(self, path: str, seed: dict[tuple[int, int], dict[str, Any]]) -> None:
+        self.path = path
+        now = time.monotonic()
+        # "{pse}-{port}:" line id -> (monotonic time received, raw line,
+        # parsed report); the raw line lets a repeated report skip parsing
+        self._reports: dict[bytes, tuple[float, bytes, dict[str, Any]]] = {
+            f"{pse}-{port}:".encode(): (now, b"", report)
+            for (pse, port), report in seed.items()
+        }
+        self._partial = b""
+        self._fd: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._fd is not None
+
+    def start(self) -> None:
+        """Open the UART and start consuming it on the running loop."""
+        fd = os.open(self.path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            if self.path not in _configured_ttys:
+                _configure_tty(fd)
+                _configured_ttys.add(self.path)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(fd, self._on_readable)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def stop(self) -> None:
+        if self._fd is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+    def snapshot(
+        self, port_ids: frozenset[bytes], max_age: float,
+    ) -> dict[tuple[int, int], dict[str, Any]]:
+        """Reports for `port_ids` received within the last `max_age` seconds."""
+        cutoff = time.monotonic() - max_age
+        return {
+            (report["pse_num"], report["port_num"]): report
+            for port_id, (received, _, report) in self._reports.items()
+            if received >= cutoff and port_id in port_ids
+        }
+
+    def _on_readable(self) -> None:
+        fd = self._fd
+        if fd is None:
+            return
+        try:
+            chunk = os.read(fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as ex:
+            _LOGGER.debug("ESP32 stream on %s failed: %s", self.path, ex)
+            self.stop()
+            return
+        if not chunk:
+            self.stop()
+            return
+        *complete, partial = (self._partial + chunk).split(b"\n")
+        self._partial = partial if len(partial) <= _ESP32_MAX_LINE else b""
+        now = time.monotonic()
+        for line in complete:
+            port_id = line[:4]
+            if port_id not in _ESP32_PORT_IDS:
+                continue
+            # Idle and steady ports repeat the same line every cycle
+            previous = self._reports.get(port_id)
+            if previous is not None and previous[1] == line:
+                self._reports[port_id] = (now, line, previous[2])
+                continue
+            parsed = _parse_esp32_line(line.decode('ascii', errors='ignore'))
+            if parsed:
+                self._reports[port_id] = (now, line, parsed)
+
+
+_ESP32_DEVICE_PATHS = (Path("/dev/pse"), Path("/dev/ttyAMA3"))
+# ESP32 UART that produced data on the last refresh, if any
+_esp32_path: Path | None = None
+# Background reader on _esp32_path once a capture has found it
+_esp32_monitor: _Esp32Monitor | None = None
+
+
+def stop_esp32_monitor() -> None:
+    """Close the background ESP32 reader (integration unload)."""
+    global _esp32_monitor, _esp32_path
+    if _esp32_monitor is not None:
+        _esp32_monitor.stop()
+        _esp32_monitor = None
+    _esp32_path = None
+
+
+async def _read_all_esp32_data(
+    port_ids: frozenset[bytes] = _ESP32_PORT_IDS,
+) -> dict[tuple[int, int], dict[str, Any]]:
     """Read all ESP32 data in one pass to avoid serial port conflicts.
     
+    Returns the background monitor's recent reports when it is running;
+    otherwise captures from the UARTs and starts the monitor on the one
+    that answered.
+    
+    Args:
+        port_ids: ESP32 line ids to wait for; the capture ends as soon as
+            each has reported once
+    
     Returns:
         Dictionary mapping (pse_num, port_num) to port data
     """
-    esp32_data = {}
+    global _esp32_path, _esp32_monitor
+    
+    if _esp32_monitor is not None:
+        # Reports are once a second; a whole capture window without any
+        # means the stream stopped, so fall back to probing the UARTs.
+        if _esp32_monitor.running and (
+            esp32_data := _esp32_monitor.snapshot(port_ids, ESP32_CAPTURE_SECONDS)
+        ):
+            return esp32_data
+        stop_esp32_monitor()
     
-    # Try both /dev/pse (udev symlink) and /dev/ttyAMA3 (direct UART)
-    for device_path in [Path("/dev/pse"), Path("/dev/ttyAMA3")]:
-        if not device_path.exists():
+    esp32_data = {}
+    # Reuse the UART that worked last time; otherwise try both /dev/pse
+    # (udev symlink) and /dev/ttyAMA3 (direct UART), skipping the second when
+    # it is the same device, so a silent ESP32 is only waited on once.
+    if _esp32_path is not None:
+        candidates = [_esp32_path]
+    else:
+        candidates = [p for p in _ESP32_DEVICE_PATHS if _cached_exists(p)]
+    tried: set[str] = set()
+    for device_path in candidates:
+        real_path = os.path.realpath(device_path)
+        if real_path in tried:
             continue
+        tried.add(real_path)
         
         try:
             _LOGGER.debug("Reading ESP32 stream from %s for all ports", device_path)
             
-            # Configure serial port for ESP32 (115200 baud, raw mode, no echo)
-            stty_proc = await asyncio.create_subprocess_exec(
-                "stty", "-F", str(device_path), "115200", "raw", "-echo",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await stty_proc.communicate()
-            
-            # Read serial stream for 3 seconds to capture multiple update cycles
-            proc = await asyncio.create_subprocess_exec(
-                "timeout", "3", "cat", str(device_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.DEVNULL
+            # Read the serial stream until every port has reported (ESP32
+            # outputs all ports once per second), at most ESP32_CAPTURE_SECONDS,
+            # and parse it in the same worker thread
+            esp32_data = await asyncio.to_thread(
+                _capture_esp32, str(device_path), port_ids,
             )
             
-            stdout, _ = await proc.communicate()
-            
-            # Keep the most recent data for each port
-            for line in stdout.decode('utf-8', errors='ignore').split('\n'):
-                parsed = _parse_esp32_line(line)
-                if parsed:
-                    key = (parsed["pse_num"], parsed["port_num"])
-                    esp32_data[key] = parsed  # Keep most recent
-            
             if esp32_data:
                 _LOGGER.debug("Found ESP32 data for %d ports", len(esp32_data))
+                _esp32_path = device_path
                 break  # Successfully read data, no need to try other device
             
         except Exception as ex:
             _LOGGER.debug("Failed to read ESP32 stream from %s: %s", device_path, ex)
             continue
     
+    if not esp32_data:
+        _esp32_path = None  # probe all candidates again next refresh
+        return esp32_data
+    
+    # Keep the UART that answered open, so later refreshes need no capture
+    monitor = _Esp32Monitor(str(_esp32_path), esp32_data)
+    try:
+        monitor.start()
+    except Exception as ex:
+        _LOGGER.debug("Cannot monitor ESP32 stream on %s: %s", _esp32_path, ex)
+    else:
+        _esp32_monitor = monitor
     return esp32_data
 
 
-async def read_all_onboard_ports(interfaces: list[str], switch_mode_discovery: bool = False) -> dict[str, dict[str, Any]]:
+async def query_esp32(
+    command: str, until: frozenset[bytes] = frozenset(),
+) -> list[str]:
+    """Send a console command to the ESP32 and return what it prints.
+
+    Reads for up to ESP32_CAPTURE_SECONDS, or until a line starting with each
+    prefix in `until` has arrived. Port status lines streamed meanwhile are
+    included; callers pick out the lines they need. Meant for startup,
+    before the background monitor holds the UART.
+
+    Returns:
+        Stripped output lines, empty if no ESP32 UART exists
+    """
+    device_path = _esp32_path or next(
+        (p for p in _ESP32_DEVICE_PATHS if _cached_exists(p)), None,
+    )
+    if device_path is None:
+        return []
+    lines = await asyncio.to_thread(
+        _drain_uart, str(device_path), ESP32_CAPTURE_SECONDS, until, None,
+        f"{command}\n".encode(),
+    )
+    return [line.decode('ascii', errors='ignore').strip() for line in lines]
+
+
+async def _load_traffic_snapshot() -> dict[str, tuple[int, int]] | None:
+    """Byte counters for all interfaces, or None to read them per port."""
+    try:
+        return await asyncio.to_thread(_read_net_dev)
+    except (OSError, ValueError) as ex:
+        _LOGGER.debug("Failed to read /proc/net/dev: %s", ex)
+        return None
+
+
+async def read_all_onboard_ports(
+    interfaces: list[str],
+    switch_mode_discovery: bool = False,
+    arp_snapshot: dict[str, str] | None = None,
+) -> dict[str, dict[str, Any]]:
     """Read all onboard PoE network interfaces.
 
-    Reads ESP32 data once for all ports to avoid serial port conflicts,
-    then reads network status for each interface.
+    Reads ESP32 data, the neighbour table and interface byte counters once
+    for all ports, then reads network status for each interface.
 
     Args:
         interfaces: list of interface names (e.g., ["poe0", "poe1", ...])
         switch_mode_discovery: resolve bridge-member ports via FDB + arp-scan
+        arp_snapshot: Neighbour table from load_arp_table() that the caller
+            already holds; None loads one alongside the ESP32 data
 
     Returns:
         Dictionary mapping interface name to port status
     """
-    # Read all ESP32 data in one pass
-    esp32_data_map = await _read_all_esp32_data()
+    # Read all ESP32 data, the neighbour table and byte counters in one pass each
+    esp32_read = _read_all_esp32_data(_esp32_port_ids(interfaces))
+    if arp_snapshot is None:
+        esp32_data_map, arp_snapshot, traffic_snapshot = await asyncio.gather(
+            esp32_read, load_arp_table(), _load_traffic_snapshot(),
+        )
+    else:
+        esp32_data_map, traffic_snapshot = await asyncio.gather(
+            esp32_read, _load_traffic_snapshot(),
+        )
 
-    # Now read network status for each interface (can be parallel)
-    tasks = [
-        read_network_port_status(interface, esp32_data_map, switch_mode_discovery)
-        for interface in interfaces
-    ]
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    port_data = {}
-    for interface, result in zip(interfaces, results):
-        if isinstance(result, Exception):
-            _LOGGER.error("Failed to read interface %s: %s", interface, result)
-            port_data[interface] = {
-                "available": False,
-                "state": "error",
-                "error": str(result),
-            }
-        else:
-            port_data[interface] = result
-    
-    return port_data
+    # Read ports concurrently, capped so a refresh cannot spawn a burst of
+    # tcpdump/arp-scan/DNS work for every port at once
+    sem = asyncio.Semaphore(PORT_READ_CONCURRENCY)
+    # Each port is stored the moment it completes, not after the slowest one
+    results: dict[str, dict[str, Any]] = {}
+
+    async def _read_port(interface: str) -> None:
+        # Errors are caught per port so one failure never cancels the others
+        async with sem:
+            try:
+                results[interface] = await read_network_port_status(
+                    interface, esp32_data_map, switch_mode_discovery, arp_snapshot,
+                    traffic_snapshot,
+                )
+            except Exception as ex:
+                _LOGGER.error("Failed to read interface %s: %s", interface, ex)
+                results[interface] = {"available": False, "state": "error", "error": str(ex)}
+
+    async with asyncio.TaskGroup() as tg:
+        for interface in interfaces:
+            tg.create_task(_read_port(interface))
+
+    # Rebuild in interface order; completion order varies between refreshes
+    return {interface: results[interface] for interface in interfaces}
 
@@ -21,6 +21,27 @@ from .coordinator import ExavizDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# System info keys shown on the board status sensor (gathered once at startup)
+_SYSTEM_INFO_ATTRS = (
+    "compute_module",
+    "cm_model",
+    "total_ram_gb",
+    "has_wifi",
+    "emmc_storage",
+    "os_version",
+    "kernel_version",
+    "dkms_driver_version",
+    "netplan_version",
+    "poe_controller",
+    "esp32_firmware_version",
+    "board_model_esp32",
+    "board_hw_version",
+    "board_serial",
+    "board_identifier",
+    "poe_driver_version",
+    "plugin_version",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -74,6 +95,9 @@ class ExavizPoECurrentSensor(ExavizPoEBaseEntity, SensorEntity):
             entity_suffix="current",
             entity_name_suffix="Current"
         )
+        # extra_state_attributes for the coordinator.data it was built from
+        self._attrs_source: dict[str, Any] | None = None
+        self._attrs: dict[str, Any] | None = None
 
     @property
     def device_class(self) -> SensorDeviceClass:
@@ -99,7 +123,19 @@ class ExavizPoECurrentSensor(ExavizPoEBaseEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes."""
+        """Return additional state attributes.
+
+        Built once per coordinator refresh; HA copies the mapping on each
+        state write, so every read until the next refresh reuses it.
+        """
+        data = self.coordinator.data
+        if data is not self._attrs_source:
+            self._attrs = self._build_attributes()
+            self._attrs_source = data
+        return self._attrs
+
+    def _build_attributes(self) -> dict[str, Any] | None:
+        """Assemble the port and power attributes from the current snapshot."""
         base_attrs = super().extra_state_attributes
         if not base_attrs:
             return None
@@ -124,6 +160,21 @@ class ExavizPoECurrentSensor(ExavizPoEBaseEntity, SensorEntity):
         return base_attrs
 
 
+def _board_device_info(
+    coordinator: ExavizDataUpdateCoordinator, entry_id: str
+) -> dict[str, Any]:
+    """Device info for the carrier board itself (board type is fixed at setup)."""
+    board_type = coordinator.board_type
+    board_name = board_type.value.title() if board_type else "Unknown"
+    return {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": f"Exaviz {board_name}",
+        "manufacturer": "Exaviz (by Axzez LLC)",
+        "model": f"{board_name} Carrier Board",
+        "sw_version": "1.0.0",
+    }
+
+
 class ExavizServerStatusSensor(CoordinatorEntity, SensorEntity):
     """Sensor for Exaviz local board status."""
 
@@ -134,21 +185,21 @@ class ExavizServerStatusSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = "Board Status"
         self._attr_unique_id = f"{entry_id}_board_status"
         self._attr_icon = "mdi:chip"
+        self._attr_device_info = _board_device_info(coordinator, entry_id)
         self.entity_id = "sensor.board_status"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        board_type = self.coordinator.board_type
-        board_name = board_type.value.title() if board_type else "Unknown"
-        
-        return {
-            "identifiers": {(DOMAIN, self._entry_id)},
-            "name": f"Exaviz {board_name}",
-            "manufacturer": "Exaviz (by Axzez LLC)",
-            "model": f"{board_name} Carrier Board",
-            "sw_version": "1.0.0",
+        # Board layout and system info are fixed once the coordinator is set
+        # up, so only the live stats are looked up per state write
+        board_info = coordinator.board_info
+        self._static_attrs: dict[str, Any] = {
+            "board_type": board_info.get("board_type", "unknown"),
+            "total_poe_ports": board_info.get("total_poe_ports", 0),
+            "onboard_ports": board_info.get("onboard_ports", 0),
+            "addon_boards": board_info.get("addon_boards", 0),
         }
+        self._static_attrs.update(
+            (key, board_info[key]) for key in _SYSTEM_INFO_ATTRS if key in board_info
+        )
 
     @property
     def native_value(self) -> str:
@@ -162,37 +213,7 @@ class ExavizServerStatusSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        board_info = self.coordinator.board_info
-
-        attrs: dict[str, Any] = {
-            "board_type": board_info.get("board_type", "unknown"),
-            "total_poe_ports": board_info.get("total_poe_ports", 0),
-            "onboard_ports": board_info.get("onboard_ports", 0),
-            "addon_boards": board_info.get("addon_boards", 0),
-        }
-
-        # System info (gathered once at startup)
-        for key in (
-            "compute_module",
-            "cm_model",
-            "total_ram_gb",
-            "has_wifi",
-            "emmc_storage",
-            "os_version",
-            "kernel_version",
-            "dkms_driver_version",
-            "netplan_version",
-            "poe_controller",
-            "esp32_firmware_version",
-            "board_model_esp32",
-            "board_hw_version",
-            "board_serial",
-            "board_identifier",
-            "poe_driver_version",
-            "plugin_version",
-        ):
-            if key in board_info:
-                attrs[key] = board_info[key]
+        attrs = dict(self._static_attrs)
 
         # Live PoE stats (updated each poll cycle)
         if self.coordinator.data:
@@ -219,11 +240,10 @@ class ExavizBoardTemperatureSensor(CoordinatorEntity, SensorEntity):
 
     Reads /sys/class/thermal/thermal_zone0/temp which reports the
     Broadcom BCM2712 SoC temperature in millidegrees Celsius.
-    Updated every coordinator poll cycle alongside PoE data.
+    Updated every coordinator poll cycle alongside PoE data; the
+    coordinator does the read, so this entity never touches sysfs.
     """
 
-    _THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
-
     def __init__(self, coordinator: ExavizDataUpdateCoordinator, entry_id: str) -> None:
         """Initialize the board temperature sensor."""
         super().__init__(coordinator)
@@ -231,6 +251,8 @@ class ExavizBoardTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = "Board Temperature"
         self._attr_unique_id = f"{entry_id}_board_temperature"
         self._attr_icon = "mdi:thermometer"
+        # Same parent device as board status
+        self._attr_device_info = _board_device_info(coordinator, entry_id)
         self.entity_id = "sensor.board_temperature"
 
     @property
@@ -248,19 +270,6 @@ class ExavizBoardTemperatureSensor(CoordinatorEntity, SensorEntity):
         """Return the unit of measurement."""
         return UnitOfTemperature.CELSIUS
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information (same parent device as board status)."""
-        board_type = self.coordinator.board_type
-        board_name = board_type.value.title() if board_type else "Unknown"
-        return {
-            "identifiers": {(DOMAIN, self._entry_id)},
-            "name": f"Exaviz {board_name}",
-            "manufacturer": "Exaviz (by Axzez LLC)",
-            "model": f"{board_name} Carrier Board",
-            "sw_version": "1.0.0",
-        }
-
     @property
     def native_value(self) -> float | None:
         """Return the SoC temperature in degrees Celsius."""
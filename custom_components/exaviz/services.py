@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 
 import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN
+from .utils import build_entity_id, parse_entity_prefix
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,77 +29,66 @@ POE_PORT_CONTROL_WITH_ACTION_SCHEMA = vol.Schema({
     ),
 })
 
-RESET_PORT_SCHEMA = vol.Schema({
-    vol.Required("entity_id"): cv.string,
-})
+# Resetting takes the same single entity_id as on/off/toggle
+RESET_PORT_SCHEMA = POE_PORT_CONTROL_SCHEMA
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Exaviz integration."""
+async def _refresh_data(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Refresh integration data from all coordinators."""
+    _LOGGER.info("Refreshing Exaviz integration data")
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if hasattr(coordinator, "async_request_refresh"):
+            await coordinator.async_request_refresh()
 
-    async def refresh_data(call: ServiceCall) -> None:
-        """Refresh integration data from all coordinators."""
-        _LOGGER.info("Refreshing Exaviz integration data")
-        for coordinator in hass.data.get(DOMAIN, {}).values():
-            if hasattr(coordinator, "async_request_refresh"):
-                await coordinator.async_request_refresh()
-
-    async def turn_on_port(call: ServiceCall) -> None:
-        """Turn on a PoE port."""
-        entity_id = call.data["entity_id"]
-        await _control_poe_port(hass, entity_id, "turn_on")
-
-    async def turn_off_port(call: ServiceCall) -> None:
-        """Turn off a PoE port."""
-        entity_id = call.data["entity_id"]
-        await _control_poe_port(hass, entity_id, "turn_off")
-
-    async def toggle_port(call: ServiceCall) -> None:
-        """Toggle a PoE port."""
-        entity_id = call.data["entity_id"]
-        await _control_poe_port(hass, entity_id, "toggle")
-
-    async def control_port(call: ServiceCall) -> None:
-        """Control a PoE port with specified action."""
-        entity_id = call.data["entity_id"]
-        action = call.data.get("action", "toggle")
-        await _control_poe_port(hass, entity_id, action)
-
-    async def reset_port(call: ServiceCall) -> None:
-        """Reset a PoE port (power cycle) by pressing its reset button."""
-        entity_id = call.data["entity_id"]
-        _LOGGER.info("Resetting PoE port: %s", entity_id)
-
-        # Derive the button entity_id from the switch entity_id.
-        # switch.onboard_port0 -> button.onboard_port0_reset
-        button_entity_id = entity_id.replace("switch.", "button.") + "_reset"
-
-        await hass.services.async_call(
-            "button", "press",
-            {"entity_id": button_entity_id},
-            blocking=True,
-        )
-        _LOGGER.info("Port reset completed for %s", entity_id)
 
-    hass.services.async_register(
-        DOMAIN, "refresh_data", refresh_data, schema=REFRESH_DATA_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, "turn_on_port", turn_on_port, schema=POE_PORT_CONTROL_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, "turn_off_port", turn_off_port, schema=POE_PORT_CONTROL_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, "toggle_port", toggle_port, schema=POE_PORT_CONTROL_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, "control_port", control_port,
-        schema=POE_PORT_CONTROL_WITH_ACTION_SCHEMA,
+async def _port_action(hass: HomeAssistant, call: ServiceCall, action: str | None = None) -> None:
+    """Turn on, turn off or toggle a PoE port.
+
+    turn_on_port/turn_off_port/toggle_port fix the action; control_port
+    takes it from the call (default toggle).
+    """
+    await _control_poe_port(
+        hass, call.data["entity_id"], action or call.data.get("action", "toggle"),
     )
-    hass.services.async_register(
-        DOMAIN, "reset_port", reset_port, schema=RESET_PORT_SCHEMA
+
+
+async def _reset_port(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Reset a PoE port (power cycle) by pressing its reset button."""
+    entity_id = call.data["entity_id"]
+    _LOGGER.info("Resetting PoE port: %s", entity_id)
+
+    # Derive the button entity_id from any of the port's entity ids.
+    # switch.onboard_port0 -> button.onboard_port0_reset
+    poe_set, port_number = parse_entity_prefix(entity_id)
+    if poe_set is None or port_number is None:
+        raise ServiceValidationError(
+            f"Cannot reset {entity_id}: not an Exaviz PoE port entity"
+        )
+    button_entity_id = build_entity_id("button", poe_set, port_number, "reset")
+
+    await hass.services.async_call(
+        "button", "press",
+        {"entity_id": button_entity_id},
+        blocking=True,
     )
+    _LOGGER.info("Port reset completed for %s", entity_id)
+
+
+# (service name, handler taking (hass, call), schema)
+_SERVICES = (
+    ("refresh_data", _refresh_data, REFRESH_DATA_SCHEMA),
+    ("turn_on_port", partial(_port_action, action="turn_on"), POE_PORT_CONTROL_SCHEMA),
+    ("turn_off_port", partial(_port_action, action="turn_off"), POE_PORT_CONTROL_SCHEMA),
+    ("toggle_port", partial(_port_action, action="toggle"), POE_PORT_CONTROL_SCHEMA),
+    ("control_port", _port_action, POE_PORT_CONTROL_WITH_ACTION_SCHEMA),
+    ("reset_port", _reset_port, RESET_PORT_SCHEMA),
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Exaviz integration."""
+    for name, handler, schema in _SERVICES:
+        hass.services.async_register(DOMAIN, name, partial(handler, hass), schema=schema)
 
 
 async def _control_poe_port(
@@ -110,11 +102,12 @@ async def _control_poe_port(
     """
     _LOGGER.debug("PoE port control: %s -> %s", entity_id, action)
 
-    # Ensure the entity_id is a switch
+    # Ensure the entity_id is a switch: sensor.onboard_port0_current and
+    # binary_sensor.addon_0_port3_powered map to their port's switch
     if not entity_id.startswith("switch."):
-        entity_id = entity_id.replace("sensor.", "switch.").split("_current")[0]
-        entity_id = entity_id.replace("binary_sensor.", "switch.").split("_powered")[0]
-        entity_id = entity_id.replace("binary_sensor.", "switch.").split("_plug")[0]
+        poe_set, port_number = parse_entity_prefix(entity_id)
+        if poe_set is not None and port_number is not None:
+            entity_id = build_entity_id("switch", poe_set, port_number)
 
     service = action  # turn_on, turn_off, toggle are HA switch services
     await hass.services.async_call(
@@ -127,8 +120,5 @@ async def _control_poe_port(
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload services for Exaviz integration."""
-    for service_name in (
-        "refresh_data", "turn_on_port", "turn_off_port",
-        "toggle_port", "control_port", "reset_port",
-    ):
+    for service_name, _, _ in _SERVICES:
         hass.services.async_remove(DOMAIN, service_name)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
@@ -38,6 +39,54 @@ _LOGGER = logging.getLogger(__name__)
 # Device path for ESP32 serial interface (udev symlink or direct UART)
 _PSE_DEVICE_PATHS = [Path("/dev/pse"), Path("/dev/ttyAMA3")]
 
+# Write-only descriptor for the first device path that opened, kept for the
+# life of the process. The HA user needs write access to the UART (the
+# dialout group, or a udev rule on /dev/pse); no sudo is involved.
+_pse_fd: int | None = None
+
+
+def _open_pse_device() -> int | None:
+    """Return the cached ESP32 command descriptor, opening it on first use."""
+    global _pse_fd
+    if _pse_fd is not None:
+        return _pse_fd
+    for device_path in _PSE_DEVICE_PATHS:
+        try:
+            _pse_fd = os.open(
+                device_path,
+                os.O_WRONLY | os.O_NOCTTY | os.O_NONBLOCK | os.O_CLOEXEC,
+            )
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            _LOGGER.warning("Could not open %s: %s", device_path, exc)
+            continue
+        _LOGGER.debug("Opened ESP32 command device %s", device_path)
+        return _pse_fd
+    return None
+
+
+def _close_pse_device() -> None:
+    """Drop the cached descriptor so the next command reopens the device."""
+    global _pse_fd
+    if _pse_fd is not None:
+        try:
+            os.close(_pse_fd)
+        except OSError:
+            pass
+        _pse_fd = None
+
+
+async def _wait_writable(fd: int) -> None:
+    """Wait until the UART transmit buffer has room again."""
+    loop = asyncio.get_running_loop()
+    writable = loop.create_future()
+    loop.add_writer(fd, writable.set_result, None)
+    try:
+        await asyncio.wait_for(writable, timeout=1.0)
+    finally:
+        loop.remove_writer(fd)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -203,32 +252,32 @@ class ExavizPoEPortSwitch(ExavizPoEBaseEntity, SwitchEntity):
     async def _send_esp32_command(command: str) -> bool:
         """Send a text command to the ESP32 via /dev/pse serial interface.
 
+        The line is written straight to a cached non-blocking descriptor; a
+        full transmit buffer waits for writability instead of blocking.
+
         Returns True if the command was written successfully.
         """
-        for device_path in _PSE_DEVICE_PATHS:
-            if not device_path.exists():
-                continue
-
-            try:
-                proc = await asyncio.create_subprocess_exec(
-                    "bash", "-c", f"echo '{command}' > {device_path}",
-                    stdout=asyncio.subprocess.DEVNULL,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                _, stderr = await proc.communicate()
-                if proc.returncode == 0:
-                    _LOGGER.info("Sent ESP32 command: %s → %s", command, device_path)
-                    return True
-                _LOGGER.warning(
-                    "ESP32 command '%s' failed on %s: %s",
-                    command, device_path,
-                    stderr.decode(errors="replace").strip(),
-                )
-            except OSError as exc:
-                _LOGGER.warning("Could not write to %s: %s", device_path, exc)
-
-        _LOGGER.error("No ESP32 serial device found for command: %s", command)
-        return False
+        fd = _open_pse_device()
+        if fd is None:
+            _LOGGER.error("No ESP32 serial device found for command: %s", command)
+            return False
+
+        payload = f"{command}\n".encode()
+        try:
+            while payload:
+                try:
+                    written = os.write(fd, payload)
+                except BlockingIOError:
+                    await _wait_writable(fd)
+                    continue
+                payload = payload[written:]
+        except (OSError, asyncio.TimeoutError) as exc:
+            _LOGGER.warning("ESP32 command '%s' failed: %s", command, exc)
+            _close_pse_device()
+            return False
+
+        _LOGGER.info("Sent ESP32 command: %s", command)
+        return True
 
     async def _esp32_disable_port(self) -> bool:
         """Disable a port on the TPS23861 via ESP32 command.
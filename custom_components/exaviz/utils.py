@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 
 from homeassistant.exceptions import ServiceValidationError
 
 _LOGGER = logging.getLogger(__name__)
 
+# {poe_set}_port{N}[_suffix]; poe_set may contain underscores (e.g. addon_0)
+_ENTITY_PORT_RE = re.compile(r"(.+?)_port(\d+)(?:_|$)")
+
 
 def sudo_argv(*args: str) -> tuple[str, ...]:
     """Prefix a command with sudo only when not already running as root.
@@ -92,17 +96,13 @@ def parse_entity_prefix(entity_id: str) -> tuple[str | None, int | None]:
     Returns:
         Tuple of (poe_set, port_number) or (None, None) if parsing fails
     """
-    import re
-
     try:
         if "." in entity_id:
             _, suffix = entity_id.split(".", 1)
         else:
             suffix = entity_id
 
-        # Match: {poe_set}_port{N}[_suffix]
-        # poe_set may contain underscores (e.g. addon_0)
-        m = re.match(r"^(.+?)_port(\d+)(?:_|$)", suffix)
+        m = _ENTITY_PORT_RE.match(suffix)
         if m:
             return m.group(1), int(m.group(2))
 
@@ -1,6 +1,6 @@
 """Tests for board detection logic."""
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from custom_components.exaviz.board_detector import (
     BoardType,
@@ -31,6 +31,22 @@ class TestNonBlockingDetection:
                 assert result == []
 
 
+class TestDetectAddonBoards:
+
+    @pytest.mark.asyncio
+    async def test_pse_ids_from_proc_pse_snapshot(self):
+        proc_pse = (
+            "Axzez Interceptor PoE driver version 2.0\n"
+            "0-0: power-on 0 15.50 47.9375 0.05950/0.80000 33.1250/150.0000\n"
+            "1-7: disabled ? 0.00 47.9375 0.00000/0.80000 34.6250/150.0000\n"
+            "0: 47.9375/40.0000-60.0000 0.05950/2.50000 15.50/120\n"
+        )
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("custom_components.exaviz.board_detector.read_proc_pse",
+                   AsyncMock(return_value=proc_pse)):
+            assert await detect_addon_boards() == ["pse0", "pse1"]
+
+
 class TestDetectAllPoeSystems:
     """End-to-end detection with sub-functions mocked."""
 
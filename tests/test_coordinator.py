@@ -1,4 +1,5 @@
 """Tests for the data update coordinator."""
+import os
 from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -130,7 +131,8 @@ class TestDataUpdate:
                 "class": "?", "allocated_power_watts": 15.4, "connected_device": None},
         }
 
-        with patch("custom_components.exaviz.coordinator.read_all_addon_ports", return_value=mock_port_data):
+        with patch("custom_components.exaviz.coordinator.load_arp_table", return_value={}), \
+             patch("custom_components.exaviz.coordinator.read_all_addon_ports", return_value=mock_port_data):
             data = await coordinator._async_update_data()
 
         poe = data["poe"]
@@ -138,6 +140,52 @@ class TestDataUpdate:
         assert len(poe["addon_0"]["ports"]) == 2
         assert poe["addon_0"]["used_power_watts"] == 12.0
 
+    @pytest.mark.asyncio
+    async def test_addon_boards_share_one_arp_snapshot(self, coordinator):
+        coordinator.board_type = BoardType.INTERCEPTOR
+        coordinator.onboard_ports = []
+        coordinator.addon_boards = ["pse0", "pse1"]
+        snapshot = {"poe9": "192.168.1.9 lladdr 00:11:22:33:44:55 REACHABLE"}
+
+        with patch("custom_components.exaviz.coordinator.load_arp_table", return_value=snapshot) as load, \
+             patch("custom_components.exaviz.coordinator.read_all_addon_ports", return_value={}) as read:
+            await coordinator._async_update_data()
+
+        assert load.call_count == 1
+        assert [c.kwargs["arp_snapshot"] for c in read.call_args_list] == [snapshot, snapshot]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_board_gives_equal_snapshots(self, coordinator):
+        """always_update=False relies on == between refreshes."""
+        coordinator.board_type = BoardType.CRUISER
+        coordinator.onboard_ports = ["poe0"]
+        coordinator.addon_boards = []
+        port = {"available": True, "enabled": True, "state": "active", "power_watts": 5.0,
+                "connected_device": None}
+
+        with patch("custom_components.exaviz.coordinator.read_all_onboard_ports",
+                   return_value={"poe0": port}), \
+             patch.object(coordinator, "_read_board_temperature", return_value=48.2):
+            first = await coordinator._async_update_data()
+            second = await coordinator._async_update_data()
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_onboard_ports_reuse_addon_arp_snapshot(self, coordinator):
+        coordinator.board_type = BoardType.INTERCEPTOR
+        coordinator.onboard_ports = ["poe0"]
+        coordinator.addon_boards = ["pse0"]
+        snapshot = {"poe0": "192.168.1.9 lladdr 00:11:22:33:44:55 REACHABLE"}
+
+        with patch("custom_components.exaviz.coordinator.load_arp_table", return_value=snapshot) as load, \
+             patch("custom_components.exaviz.coordinator.read_all_addon_ports", return_value={}), \
+             patch("custom_components.exaviz.coordinator.read_all_onboard_ports", return_value={}) as onboard:
+            await coordinator._async_update_data()
+
+        assert load.call_count == 1
+        assert onboard.call_args.args[2] is snapshot
+
     @pytest.mark.asyncio
     async def test_active_port_without_arp_gets_placeholder(self, coordinator):
         """Active port with no ARP entry should get 'Unknown Device' placeholder."""
@@ -190,6 +238,66 @@ class TestDataUpdate:
                 await coordinator._async_update_data()
 
 
+class TestEsp32Info:
+
+    @pytest.mark.asyncio
+    async def test_info_response_parsed(self, coordinator):
+        response = [
+            "0-0: disabled 0 0 0.000 0/0 30.0",
+            "Exaviz PoE monitor version 1.4.2",
+            "board model: cruiser",
+            "board version: 2",
+            "board serial: CR-0042",
+        ]
+        with patch("custom_components.exaviz.coordinator.query_esp32",
+                   AsyncMock(return_value=response)) as query:
+            info = await coordinator._query_esp32_info()
+
+        assert query.call_args.args[0] == "info"
+        assert info == {
+            "esp32_firmware_version": "1.4.2",
+            "board_model_esp32": "Cruiser",
+            "board_hw_version": "2",
+            "board_serial": "CR-0042",
+        }
+
+
+class TestBoardTemperature:
+
+    @pytest.mark.asyncio
+    async def test_thermal_file_opened_once_and_reread(self, coordinator, tmp_path):
+        thermal = tmp_path / "temp"
+        thermal.write_text("55100\n")
+        coordinator._THERMAL_PATH = str(thermal)
+        read = ExavizDataUpdateCoordinator._read_board_temperature
+
+        with patch("os.open", wraps=os.open) as opened:
+            first = await read(coordinator)
+            thermal.write_text("48250\n")
+            second = await read(coordinator)
+        await coordinator.async_shutdown()
+
+        assert (first, second) == (55.1, 48.2)
+        assert opened.call_count == 1
+        assert coordinator._thermal_fd is None
+
+    @pytest.mark.asyncio
+    async def test_missing_thermal_zone(self, coordinator, tmp_path):
+        coordinator._THERMAL_PATH = str(tmp_path / "missing")
+        assert await ExavizDataUpdateCoordinator._read_board_temperature(coordinator) is None
+        assert coordinator._thermal_fd is None
+
+
+class TestShutdown:
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_esp32_monitor(self, coordinator):
+        with patch("custom_components.exaviz.coordinator.stop_esp32_monitor") as stop:
+            await coordinator.async_shutdown()
+
+        stop.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # Power calculations
 # ---------------------------------------------------------------------------
@@ -1,10 +1,12 @@
 """Tests for device identification utilities."""
 import asyncio
 import socket
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.exaviz import device_identifier
 from custom_components.exaviz.device_identifier import (
     enrich_device_info,
     get_hostname_from_ip,
@@ -12,6 +14,13 @@ from custom_components.exaviz.device_identifier import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _getnameinfo_fallback():
+    """Exercise the getnameinfo path unless a test installs a fake aiodns."""
+    with patch.object(device_identifier, "aiodns", None):
+        yield
+
+
 class TestMacVendorLookup:
     """Test MAC vendor lookup functionality."""
 
@@ -100,6 +109,44 @@ class TestHostnameLookup:
             assert hostname is None
 
 
+class TestAiodnsHostnameLookup:
+    """Reverse lookups go through aiodns PTR queries when it is installed."""
+
+    def _fake_aiodns(self, query):
+        class DNSError(Exception):
+            pass
+
+        resolver = MagicMock()
+        resolver.query = query
+        fake = MagicMock()
+        fake.error.DNSError = DNSError
+        fake.DNSResolver.return_value = resolver
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_ptr_query_used(self):
+        query = AsyncMock(return_value=SimpleNamespace(name="cam.local"))
+        fake = self._fake_aiodns(query)
+        with patch.object(device_identifier, "aiodns", fake), \
+             patch.object(device_identifier, "_resolver", None), \
+             patch("socket.getnameinfo") as mock_getnameinfo:
+            hostname = await get_hostname_from_ip("192.168.1.100")
+
+        assert hostname == "cam.local"
+        query.assert_awaited_once_with("100.1.168.192.in-addr.arpa", "PTR")
+        mock_getnameinfo.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dns_error_returns_none(self):
+        fake = self._fake_aiodns(None)
+        fake.DNSResolver.return_value.query = AsyncMock(
+            side_effect=fake.error.DNSError(4, "Domain name not found")
+        )
+        with patch.object(device_identifier, "aiodns", fake), \
+             patch.object(device_identifier, "_resolver", None):
+            assert await get_hostname_from_ip("192.168.1.100") is None
+
+
 class TestEnrichDeviceInfo:
     """Test device info enrichment."""
 
@@ -5,11 +5,14 @@ chip and re-inits all ports. Fixed firmware re-arms DCE on enable-port alone.
 """
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from custom_components.exaviz.button import ExavizPoEPortResetButton
+from custom_components.exaviz import switch as switch_module
 from custom_components.exaviz.switch import ExavizPoEPortSwitch
 
 
@@ -110,3 +113,33 @@ async def test_enable_returns_enable_result():
         ok = await switch._esp32_enable_port()
 
     assert ok is False
+
+
+@pytest.mark.asyncio
+async def test_send_command_writes_directly(tmp_path):
+    """ESP32 commands are written to a cached descriptor, no subprocess."""
+    device = tmp_path / "pse"
+    os.mkfifo(device)
+    reader = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+    switch_module._close_pse_device()
+    try:
+        with patch.object(switch_module, "_PSE_DEVICE_PATHS", [Path(tmp_path / "missing"), device]), \
+             patch("asyncio.create_subprocess_exec") as spawn:
+            assert await ExavizPoEPortSwitch._send_esp32_command("disable-port 1 0")
+            fd = switch_module._pse_fd
+            assert await ExavizPoEPortSwitch._send_esp32_command("enable-port 1 0")
+        assert switch_module._pse_fd == fd
+        spawn.assert_not_called()
+        assert os.read(reader, 100) == b"disable-port 1 0\nenable-port 1 0\n"
+    finally:
+        switch_module._close_pse_device()
+        os.close(reader)
+
+
+@pytest.mark.asyncio
+async def test_send_command_without_device(tmp_path):
+    """No ESP32 device path means the command reports failure."""
+    switch_module._close_pse_device()
+    with patch.object(switch_module, "_PSE_DEVICE_PATHS", [Path(tmp_path / "missing")]):
+        assert await ExavizPoEPortSwitch._send_esp32_command("enable-port 1 0") is False
+    assert switch_module._pse_fd is None
@@ -1,9 +1,12 @@
 """Tests for PoE port readers."""
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 
+from custom_components.exaviz import poe_readers
 from custom_components.exaviz.poe_readers import (
     get_allocated_power_watts,
     read_pse_port_status,
@@ -12,6 +15,10 @@ from custom_components.exaviz.poe_readers import (
     read_all_addon_ports,
     _get_connected_device_from_arp,
     _detect_bosch_camera,
+    _drain_uart,
+    _parse_esp32_line,
+    _parse_link_state,
+    _read_iface_sysfs,
 )
 
 
@@ -44,11 +51,15 @@ Axzez Interceptor PoE driver version 2.0
 class TestReadPSEPortStatus:
     """Test reading individual PSE port status from /proc/pse."""
 
+    def setup_method(self):
+        poe_readers._path_exists_cache.clear()
+        poe_readers._proc_pse_snapshot = None
+        poe_readers._proc_pse_lock = None
+
     @pytest.mark.asyncio
     async def test_active_port(self):
-        mock_result = MagicMock(stdout=PROC_PSE_SAMPLE, stderr="")
         with patch("pathlib.Path.exists", return_value=True), \
-             patch("asyncio.to_thread", return_value=mock_result):
+             patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE):
             result = await read_pse_port_status("pse0", 0)
 
         assert result["available"] is True
@@ -61,9 +72,8 @@ class TestReadPSEPortStatus:
     @pytest.mark.asyncio
     async def test_backoff_port_is_enabled(self):
         """Regression: backoff must be treated as enabled (Oct 2025 fix)."""
-        mock_result = MagicMock(stdout=PROC_PSE_SAMPLE, stderr="")
         with patch("pathlib.Path.exists", return_value=True), \
-             patch("asyncio.to_thread", return_value=mock_result):
+             patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE):
             result = await read_pse_port_status("pse0", 1)
 
         assert result["state"] == "backoff"
@@ -71,9 +81,8 @@ class TestReadPSEPortStatus:
 
     @pytest.mark.asyncio
     async def test_disabled_port(self):
-        mock_result = MagicMock(stdout=PROC_PSE_SAMPLE, stderr="")
         with patch("pathlib.Path.exists", return_value=True), \
-             patch("asyncio.to_thread", return_value=mock_result):
+             patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE):
             result = await read_pse_port_status("pse0", 2)
 
         assert result["state"] == "disabled"
@@ -94,6 +103,53 @@ class TestReadPSEPortStatus:
 
         assert result["available"] is False
 
+    def test_bounded_read_gives_up_when_nothing_ready(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            with patch("os.open", return_value=read_fd), \
+                 patch.object(poe_readers, "PROC_PSE_READ_TIMEOUT", 0.05):
+                assert poe_readers._read_proc_pse_bounded() == ""
+        finally:
+            os.close(write_fd)
+
+    def test_bounded_read_returns_snapshot(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, PROC_PSE_SAMPLE.encode())
+        try:
+            with patch("os.open", return_value=read_fd):
+                assert poe_readers._read_proc_pse_bounded() == PROC_PSE_SAMPLE
+        finally:
+            os.close(write_fd)
+
+    @pytest.mark.asyncio
+    async def test_proc_pse_existence_cached(self):
+        with patch("pathlib.Path.exists", return_value=True) as mock_exists, \
+             patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE):
+            for port in range(4):
+                await read_pse_port_status("pse0", port)
+
+        assert mock_exists.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_ports_share_one_read(self):
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE) as read:
+            results = await asyncio.gather(
+                *(read_pse_port_status("pse0", port) for port in range(3))
+            )
+
+        assert read.call_count == 1
+        assert [r["state"] for r in results] == ["power-on", "backoff", "disabled"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_refreshed_after_ttl(self):
+        with patch("asyncio.to_thread", return_value=PROC_PSE_SAMPLE) as read:
+            await poe_readers.read_proc_pse()
+            with patch("time.monotonic", return_value=time.monotonic() + 60):
+                await poe_readers.read_proc_pse()
+
+        assert read.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # PSE-to-port mapping (Cruiser TPS23861 → ESP32)
@@ -107,9 +163,10 @@ class TestCruiserPSEMapping:
         (4, 0, 0), (5, 0, 1), (6, 0, 2), (7, 0, 3),
     ])
     def test_forward_mapping(self, linux_port, expected_pse, expected_pse_port):
-        pse_num = 1 if linux_port < 4 else 0
-        pse_port = linux_port % 4
-        assert (pse_num, pse_port) == (expected_pse, expected_pse_port)
+        assert poe_readers._ESP32_PORT_KEYS[linux_port] == (expected_pse, expected_pse_port)
+
+    def test_capture_waits_only_for_configured_ports(self):
+        assert poe_readers._esp32_port_ids(["poe1", "poe6", "poe8", "eth0"]) == {b"1-1:", b"0-2:"}
 
     def test_real_world_camera_scenario(self):
         """Cameras on P2, P6, P7, P8 → poe1, poe5, poe6, poe7."""
@@ -122,6 +179,371 @@ class TestCruiserPSEMapping:
         assert actual_linux == expected_linux
 
 
+class TestParseField:
+
+    def test_string_pattern_compiled_once(self):
+        poe_readers._FIELD_PATTERNS.clear()
+        assert poe_readers._parse_field("temp: 35.2 C", r"temp:\s*(\S+)") == "35.2"
+        assert poe_readers._parse_field("temp: 36.0 C", r"temp:\s*(\S+)") == "36.0"
+        assert list(poe_readers._FIELD_PATTERNS) == [r"temp:\s*(\S+)"]
+
+    def test_compiled_pattern_and_miss(self):
+        import re
+        assert poe_readers._parse_field("class 3", re.compile(r"class (\d)")) == "3"
+        assert poe_readers._parse_field("nothing", re.compile(r"class (\d)")) is None
+
+
+class TestParseEsp32Line:
+
+    def test_port_line(self):
+        result = _parse_esp32_line("0-2: power-on 3 15 48.500 0.325/0.800 35.2 \r")
+        assert (result["pse_num"], result["port_num"]) == (0, 2)
+        assert result["state"] == "power-on"
+        assert result["current_milliamps"] == 325
+        assert result["power_watts"] == round(48.5 * 0.325, 2)
+        assert result["temperature_celsius"] == 35.2
+        assert result["error"] == ""
+
+    def test_error_text_kept(self):
+        result = _parse_esp32_line("1-0: fault 0 0 0.000 0/0 31.0 over current")
+        assert result["error"] == "over current"
+        assert result["enabled"] is True
+
+    @pytest.mark.parametrize("line", [
+        "0: 48.250 1250",
+        "",
+        "0-0: power-on 3 15 48.500",
+        "a-0: power-on 3 15 48.500 0.3/0.8 35.2",
+        "0-0 power-on 3 15 48.500 0.3/0.8 35.2",
+        "0-0: power-on 3 15 48.500 0.325 35.2",
+    ])
+    def test_non_port_lines(self, line):
+        assert _parse_esp32_line(line) is None
+
+
+# ---------------------------------------------------------------------------
+# ESP32 UART capture (termios + select, no stty/cat subprocesses)
+# ---------------------------------------------------------------------------
+
+class TestDrainUart:
+
+    def setup_method(self):
+        poe_readers._configured_ttys.clear()
+        poe_readers._path_exists_cache.clear()
+        poe_readers._esp32_path = None
+
+    def teardown_method(self):
+        poe_readers.stop_esp32_monitor()
+        poe_readers._path_exists_cache.clear()
+
+    def test_tty_configured_once_per_path(self):
+        master, slave = os.openpty()
+        try:
+            path = os.ttyname(slave)
+            with patch.object(poe_readers, "_configure_tty", wraps=poe_readers._configure_tty) as configure:
+                _drain_uart(path, 0.05)
+                _drain_uart(path, 0.05)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert configure.call_count == 1
+
+    def test_low_latency_flag_set_on_serial_driver(self):
+        current = bytearray(72)
+        current[16:20] = (0x40).to_bytes(4, "little", signed=True)
+        with patch("fcntl.ioctl", side_effect=[bytes(current), b""]) as ioctl:
+            poe_readers._set_low_latency(3)
+
+        written = ioctl.call_args_list[1].args[2]
+        assert int.from_bytes(written[16:20], "little") == 0x40 | 0x2000
+
+    def test_low_latency_left_alone_when_already_set(self):
+        current = bytearray(72)
+        current[16:20] = (0x2000).to_bytes(4, "little")
+        with patch("fcntl.ioctl", return_value=bytes(current)) as ioctl:
+            poe_readers._set_low_latency(3)
+
+        assert ioctl.call_count == 1
+
+    def test_low_latency_unsupported_is_ignored(self):
+        master, slave = os.openpty()
+        try:
+            poe_readers._set_low_latency(slave)  # ptys reject TIOCGSERIAL
+        finally:
+            os.close(master)
+            os.close(slave)
+
+    def test_reads_stream_from_tty(self):
+        master, slave = os.openpty()
+        try:
+            os.write(master, b"1-0: power-on 3 15 48.500 325/800 35.2 \n")
+            lines = _drain_uart(os.ttyname(slave), 0.2)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert lines == [b"1-0: power-on 3 15 48.500 325/800 35.2 "]
+
+    def test_returns_once_every_port_reported(self):
+        master, slave = os.openpty()
+        try:
+            os.write(master, b"0-0: power-on 3 15 48.500 0.1/0.8 35.2 \n"
+                             b"0-1: disabled 0 0 0.000 0/0 30.0 \n"
+                             b"0-2: power-on 3 15 48.5")
+            start = time.monotonic()
+            lines = _drain_uart(os.ttyname(slave), 5.0, frozenset({b"0-0:", b"0-1:"}))
+            elapsed = time.monotonic() - start
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert elapsed < 2.0
+        # Trailing partial line is dropped rather than parsed with cut-off fields
+        assert len(lines) == 2
+        assert lines[-1].endswith(b"30.0 ")
+
+    def test_command_written_and_response_captured(self):
+        master, slave = os.openpty()
+        try:
+            poe_readers._configure_tty(slave)  # no echo of the response back
+            os.write(master, b"board model: cruiser\n0-0: disabled 0 0 0.000 0/0 30.0 \n"
+                             b"board serial: 1234\n")
+            lines = _drain_uart(os.ttyname(slave), 5.0,
+                                frozenset({b"board model:", b"board serial:"}),
+                                command=b"info\n")
+            sent = os.read(master, 64)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert sent == b"info\n"
+        assert lines[-1] == b"board serial: 1234"
+
+    def test_silent_uart_gives_up_after_idle_timeout(self):
+        master, slave = os.openpty()
+        try:
+            start = time.monotonic()
+            lines = _drain_uart(os.ttyname(slave), 5.0, frozenset({b"0-0:"}), 0.1)
+            elapsed = time.monotonic() - start
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert lines == []
+        assert elapsed < 1.0
+
+    def test_runaway_line_noise_is_discarded(self):
+        master, slave = os.openpty()
+        chunks = [b"\xaa" * 4096, b"\xaa" * 100 + b"\n0-0: disabled 0 0 0.000 0/0 30.0 \n", b""]
+        try:
+            with patch("select.select", side_effect=lambda r, w, x, t: (r, w, x)), \
+                 patch("os.read", side_effect=chunks):
+                lines = _drain_uart(os.ttyname(slave), 1.0)
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        # Only the tail after the reset survives; the 4 KiB prefix was dropped
+        assert lines == [b"\xaa" * 100, b"0-0: disabled 0 0 0.000 0/0 30.0 "]
+
+    @pytest.mark.asyncio
+    async def test_capture_keeps_latest_line_per_port(self):
+        capture = [
+            b"\xff\xfeboot noise\r",
+            b"1: 48.250 1250\r",
+            b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \r",
+            b"1-0: power-on 3 15 48.500 0.200/0.800 35.4 \r",
+            b"0-3: disabled 0 0 0.000 0/0 30.0 \r",
+        ]
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch.object(poe_readers, "_drain_uart", return_value=capture):
+            data = await poe_readers._read_all_esp32_data()
+
+        assert set(data) == {(1, 0), (0, 3)}
+        assert data[(1, 0)]["current_milliamps"] == 200
+
+    @pytest.mark.asyncio
+    async def test_capture_parses_only_requested_ids(self):
+        capture = [
+            b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \r",
+            b"0-3: disabled 0 0 0.000 0/0 30.0 \r",
+        ]
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch.object(poe_readers, "_drain_uart", return_value=capture), \
+             patch.object(poe_readers, "_parse_esp32_line", wraps=poe_readers._parse_esp32_line) as parse:
+            data = await poe_readers._read_all_esp32_data(frozenset({b"0-3:"}))
+
+        assert set(data) == {(0, 3)}
+        assert parse.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_capture_parses_latest_good_line_per_port_only(self):
+        capture = [b"0-0: power-on 3 15 48.500 0.100/0.800 35.2 \r"] * 50 + [
+            b"0-1: disabled 0 0 0.000 0/0 30.0 \r",
+            b"0-0: power-on 3 15 48.500 0.300/0.800 35.2 \r",
+            b"0-1: disabled 0 0 0.000 \r",  # cut short; older 0-1 line is used
+        ]
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch.object(poe_readers, "_drain_uart", return_value=capture), \
+             patch.object(poe_readers, "_parse_esp32_line", wraps=poe_readers._parse_esp32_line) as parse:
+            data = await poe_readers._read_all_esp32_data(frozenset({b"0-0:", b"0-1:"}))
+
+        assert data[(0, 0)]["current_milliamps"] == 300
+        assert data[(0, 1)]["state"] == "disabled"
+        assert parse.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_working_uart_remembered_until_it_goes_quiet(self):
+        capture = [b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \r"]
+        with patch("pathlib.Path.exists", return_value=True) as exists, \
+             patch.object(poe_readers, "_drain_uart", return_value=capture) as drain:
+            await poe_readers._read_all_esp32_data()
+            await poe_readers._read_all_esp32_data()
+            assert poe_readers._esp32_path == poe_readers._ESP32_DEVICE_PATHS[0]
+            assert drain.call_count == 2
+            assert exists.call_count == 2  # probed once, then reused
+
+            drain.return_value = []
+            assert await poe_readers._read_all_esp32_data() == {}
+        assert poe_readers._esp32_path is None
+
+    @pytest.mark.asyncio
+    async def test_monitor_keeps_latest_report_per_port(self):
+        master, slave = os.openpty()
+        try:
+            monitor = poe_readers._Esp32Monitor(os.ttyname(slave), {})
+            monitor.start()
+            os.write(master, b"0: 48.250 1250\n"
+                             b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \n"
+                             b"1-0: power-on 3 15 48.500 0.200/0.800 35.4 \n"
+                             b"0-3: disabled 0 0 0.000 0/0 30.0 \n")
+            for _ in range(50):
+                if len(monitor.snapshot(poe_readers._ESP32_PORT_IDS, 3)) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            data = monitor.snapshot(poe_readers._ESP32_PORT_IDS, 3)
+            only_0_3 = monitor.snapshot(frozenset({b"0-3:"}), 3)
+            monitor.stop()
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert set(data) == {(1, 0), (0, 3)}
+        assert data[(1, 0)]["current_milliamps"] == 200
+        assert set(only_0_3) == {(0, 3)}
+        assert not monitor.running
+
+    def test_monitor_parses_a_repeated_line_once(self):
+        read_fd, write_fd = os.pipe()
+        monitor = poe_readers._Esp32Monitor("/dev/pse", {})
+        monitor._fd = read_fd
+        try:
+            with patch.object(poe_readers, "_parse_esp32_line",
+                              wraps=poe_readers._parse_esp32_line) as parse:
+                for current in (b"0.100", b"0.100", b"0.200"):
+                    os.write(write_fd, b"1-0: power-on 3 15 48.500 " + current + b"/0.800 35.2 \n")
+                    monitor._on_readable()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert parse.call_count == 2
+        data = monitor.snapshot(poe_readers._ESP32_PORT_IDS, 3)
+        assert data[(1, 0)]["current_milliamps"] == 200
+
+    @pytest.mark.asyncio
+    async def test_refresh_served_from_monitor_after_first_capture(self):
+        capture = [b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \r"]
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch.object(poe_readers, "_drain_uart", return_value=capture) as drain, \
+             patch.object(poe_readers._Esp32Monitor, "start"), \
+             patch.object(poe_readers._Esp32Monitor, "running", True):
+            first = await poe_readers._read_all_esp32_data()
+            second = await poe_readers._read_all_esp32_data()
+
+        assert drain.call_count == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_stale_monitor_falls_back_to_capture(self):
+        capture = [b"1-0: power-on 3 15 48.500 0.100/0.800 35.2 \r"]
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch.object(poe_readers, "_drain_uart", return_value=capture) as drain, \
+             patch.object(poe_readers._Esp32Monitor, "start"), \
+             patch.object(poe_readers._Esp32Monitor, "running", True):
+            await poe_readers._read_all_esp32_data()
+            with patch("time.monotonic", return_value=time.monotonic() + 60):
+                await poe_readers._read_all_esp32_data()
+
+        assert drain.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_symlinked_uart_waited_on_once(self):
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("os.path.realpath", return_value="/dev/ttyAMA3"), \
+             patch.object(poe_readers, "_drain_uart", return_value=[]) as drain:
+            assert await poe_readers._read_all_esp32_data() == {}
+        assert drain.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Onboard sysfs reads
+# ---------------------------------------------------------------------------
+
+class TestIfaceSysfs:
+
+    def test_reads_all_attributes_in_one_pass(self, tmp_path):
+        (tmp_path / "statistics").mkdir()
+        (tmp_path / "operstate").write_text("up\n")
+        (tmp_path / "flags").write_text("0x1003\n")
+        (tmp_path / "speed").write_text("1000\n")
+        (tmp_path / "statistics" / "rx_bytes").write_text("12345\n")
+        (tmp_path / "statistics" / "tx_bytes").write_text("678\n")
+
+        assert _read_iface_sysfs(tmp_path) == ("up", "0x1003", "1000", "12345", "678")
+
+    def test_missing_files_are_none(self, tmp_path):
+        (tmp_path / "operstate").write_text("down\n")
+        assert _read_iface_sysfs(tmp_path) == ("down", None, None, None, None)
+
+    def test_net_dev_counters_for_all_interfaces(self):
+        net_dev = (
+            b"Inter-|   Receive                                                |  Transmit\n"
+            b" face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed\n"
+            b"    lo:    1200      12    0    0    0     0          0         0     1200      12    0    0    0     0       0          0\n"
+            b"  poe3: 9876543   81234    0    0    0     0          0       310   123456    1000    0    0    0     0       0          0\n"
+        )
+        with patch("builtins.open", mock_open(read_data=net_dev)):
+            stats = poe_readers._read_net_dev()
+
+        assert stats == {"lo": (1200, 1200), "poe3": (9876543, 123456)}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("operstate,lookups", [("down", 0), ("up", 1)])
+    async def test_arp_lookup_only_for_up_links(self, operstate, lookups):
+        with patch.object(poe_readers, "_cached_exists", return_value=True), \
+             patch.object(poe_readers, "_read_iface_sysfs",
+                          return_value=(operstate, "0x1003", "1000")), \
+             patch.object(poe_readers, "_get_connected_device_from_arp",
+                          new_callable=AsyncMock, return_value=None) as arp:
+            result = await poe_readers.read_network_port_status(
+                "poe2", arp_snapshot={}, traffic_snapshot={"poe2": (0, 0)},
+            )
+
+        assert result["link_state"] == operstate
+        assert arp.await_count == lookups
+
+    @pytest.mark.parametrize("raw,expected", [
+        (("up", "0x1003", "1000"), ("up", True, 1000)),
+        (("down", "0x1002", None), ("down", False, 0)),
+        (("up", "garbage", "-1"), ("up", True, -1)),
+        ((None, None, None), ("unknown", False, 0)),
+    ])
+    def test_parse_link_state(self, raw, expected):
+        assert _parse_link_state(*raw) == expected
+
+
 # ---------------------------------------------------------------------------
 # Bulk port reads
 # ---------------------------------------------------------------------------
@@ -130,7 +552,7 @@ class TestReadAllOnboardPorts:
 
     @pytest.mark.asyncio
     async def test_eight_ports(self):
-        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False):
+        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False, arp_snapshot=None, traffic_snapshot=None):
             port_num = int(interface.replace("poe", ""))
             return {
                 "available": True,
@@ -140,6 +562,7 @@ class TestReadAllOnboardPorts:
             }
 
         with patch("custom_components.exaviz.poe_readers.read_network_port_status", side_effect=mock_read), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
              patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", return_value=None):
             result = await read_all_onboard_ports([f"poe{i}" for i in range(8)])
 
@@ -147,54 +570,174 @@ class TestReadAllOnboardPorts:
         assert result["poe0"]["enabled"] is True
         assert result["poe1"]["enabled"] is False
 
+    @pytest.mark.asyncio
+    async def test_given_arp_snapshot_is_not_reloaded(self):
+        snapshot = {"poe0": "192.168.1.9 lladdr 00:11:22:33:44:55 REACHABLE"}
+        read = AsyncMock(return_value={"available": True})
+
+        with patch("custom_components.exaviz.poe_readers.read_network_port_status", read), \
+             patch("custom_components.exaviz.poe_readers._read_all_esp32_data", return_value={}), \
+             patch("custom_components.exaviz.poe_readers._load_traffic_snapshot", return_value={}), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table") as load:
+            await read_all_onboard_ports(["poe0"], arp_snapshot=snapshot)
+
+        load.assert_not_called()
+        assert read.call_args.args[3] is snapshot
+
+    @pytest.mark.asyncio
+    async def test_port_reads_are_bounded(self):
+        in_flight = peak = 0
+
+        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False, arp_snapshot=None, traffic_snapshot=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"available": True}
+
+        with patch("custom_components.exaviz.poe_readers.read_network_port_status", side_effect=mock_read), \
+             patch("custom_components.exaviz.poe_readers._read_all_esp32_data", return_value={}), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}):
+            result = await read_all_onboard_ports([f"poe{i}" for i in range(8)])
+
+        assert len(result) == 8
+        assert peak == poe_readers.PORT_READ_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_error_in_single_port_does_not_cancel_others(self):
+        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False, arp_snapshot=None, traffic_snapshot=None):
+            if interface == "poe2":
+                raise OSError("sysfs gone")
+            await asyncio.sleep(0)
+            return {"available": True}
+
+        with patch("custom_components.exaviz.poe_readers.read_network_port_status", side_effect=mock_read), \
+             patch("custom_components.exaviz.poe_readers._read_all_esp32_data", return_value={}), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}):
+            result = await read_all_onboard_ports([f"poe{i}" for i in range(4)])
+
+        assert result["poe2"] == {"available": False, "state": "error", "error": "sysfs gone"}
+        assert all(result[f"poe{i}"]["available"] for i in (0, 1, 3))
+
+    @pytest.mark.asyncio
+    async def test_results_keep_interface_order_when_completing_out_of_order(self):
+        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False, arp_snapshot=None, traffic_snapshot=None):
+            # poe0 is the slowest port, poe3 the fastest
+            for _ in range(4 - int(interface[-1])):
+                await asyncio.sleep(0)
+            return {"available": True}
+
+        with patch("custom_components.exaviz.poe_readers.read_network_port_status", side_effect=mock_read), \
+             patch("custom_components.exaviz.poe_readers._read_all_esp32_data", return_value={}), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}):
+            result = await read_all_onboard_ports([f"poe{i}" for i in range(4)])
+
+        assert list(result) == ["poe0", "poe1", "poe2", "poe3"]
+        assert all(status == {"available": True} for status in result.values())
+
     @pytest.mark.asyncio
     async def test_empty_list(self):
         result = await read_all_onboard_ports([])
         assert len(result) == 0
 
 
+def _proc_pse_text(enabled: dict[int, set[int]]) -> str:
+    """/proc/pse with eight ports per PSE; ports in `enabled` draw power."""
+    lines = ["Axzez Interceptor PoE driver version 2.0"]
+    for pse_num, ports in enabled.items():
+        for port in range(8):
+            if port in ports:
+                lines.append(f"{pse_num}-{port}: power-on 3 15.50 48.0000 0.25000/0.80000 35.0000/150.0000")
+            else:
+                lines.append(f"{pse_num}-{port}: disabled ? 0.00 48.0000 0.00000/0.80000 35.0000/150.0000")
+        lines.append(f"{pse_num}: 48.0000/40.0000-60.0000 0.25000/2.50000 15.50/120")
+    return "\n".join(lines) + "\n"
+
+
 class TestReadAllAddonPorts:
 
+    def setup_method(self):
+        poe_readers._path_exists_cache.clear()
+        poe_readers._proc_pse_snapshot = None
+        poe_readers._proc_pse_lock = None
+
     @pytest.mark.asyncio
     async def test_eight_ports(self):
-        async def mock_read(pse_id, port_num):
-            return {
-                "available": True,
-                "enabled": port_num < 4,
-                "state": "power on" if port_num < 4 else "power off",
-                "power_watts": 12.0 if port_num < 4 else 0.0,
-                "voltage_volts": 48.0,
-                "current_milliamps": 250 if port_num < 4 else 0,
-                "temperature_celsius": 35.0,
-                "class": "3",
-            }
-
-        with patch("custom_components.exaviz.poe_readers.read_pse_port_status", side_effect=mock_read), \
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=_proc_pse_text({0: {0, 1, 2, 3}})), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
              patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", return_value=None):
             result = await read_all_addon_ports("pse0", port_count=8)
 
         assert len(result) == 8
         assert result[0]["enabled"] is True
+        assert result[0]["power_watts"] == 12.0
         assert result[5]["enabled"] is False
 
     @pytest.mark.asyncio
-    async def test_error_in_single_port_does_not_crash(self):
-        call_count = 0
+    async def test_all_ports_from_one_proc_pse_read(self):
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=_proc_pse_text({0: {1}})) as read, \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
+             patch.object(poe_readers, "_split_port_line", wraps=poe_readers._split_port_line) as split:
+            result = await read_all_addon_ports("pse0", port_count=8)
 
-        async def mock_read(pse_id, port_num):
-            nonlocal call_count
-            call_count += 1
-            if port_num == 3:
-                raise Exception("Simulated I/O error")
-            return {"available": True, "enabled": True, "state": "power on", "power_watts": 10.0}
+        assert read.call_count == 1
+        assert split.call_count == 8
+        assert [p["state"] for p in result.values()].count("power-on") == 1
 
-        with patch("custom_components.exaviz.poe_readers.read_pse_port_status", side_effect=mock_read), \
-             patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", return_value=None):
+    @pytest.mark.asyncio
+    async def test_missing_and_malformed_ports(self):
+        text = _proc_pse_text({0: set()}).replace(
+            "0-2: disabled ? 0.00 48.0000", "0-2: disabled ? 0.00 bogus",
+        )
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=text), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}):
+            result = await read_all_addon_ports("pse0", port_count=10)
+
+        assert result[2]["state"] == "error"
+        assert result[9]["state"] == "unavailable"
+        assert result[1]["state"] == "disabled"
+
+    @pytest.mark.asyncio
+    async def test_error_in_single_port_does_not_crash(self):
+        async def mock_arp(interface, arp_snapshot=None):
+            if interface == "poe3":
+                raise Exception("Simulated lookup error")
+            return None
+
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=_proc_pse_text({0: set(range(5))})), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
+             patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", side_effect=mock_arp):
             result = await read_all_addon_ports("pse0", port_count=5)
 
-        assert call_count == 5
         assert len(result) == 5
-        assert result[3].get("available") is False or "error" in result[3]
+        assert result[3]["available"] is False and "error" in result[3]
+        assert all(result[p]["available"] for p in (0, 1, 2, 4))
+
+    @pytest.mark.asyncio
+    async def test_device_lookups_are_bounded(self):
+        in_flight = peak = 0
+
+        async def mock_arp(interface, arp_snapshot=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return None
+
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=_proc_pse_text({1: set(range(8))})), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
+             patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", side_effect=mock_arp):
+            result = await read_all_addon_ports("pse1", port_count=8)
+
+        assert len(result) == 8
+        assert peak == poe_readers.PORT_READ_CONCURRENCY
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +746,14 @@ class TestReadAllAddonPorts:
 
 class TestBoschCameraDetection:
 
+    def setup_method(self):
+        poe_readers._bosch_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def _no_raw_socket(self):
+        with patch.object(poe_readers, "_read_bosch_frames", side_effect=PermissionError):
+            yield
+
     @pytest.mark.asyncio
     async def test_tcpdump_not_installed(self):
         mock_proc = AsyncMock()
@@ -262,11 +813,12 @@ class TestIntegrationScenarios:
 
     @pytest.mark.asyncio
     async def test_cruiser_full_config(self):
-        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False):
+        async def mock_read(interface, esp32_data_map=None, switch_mode_discovery=False, arp_snapshot=None, traffic_snapshot=None):
             port_num = int(interface.replace("poe", ""))
             return {"available": True, "enabled": True, "state": "active", "power_watts": 10.0 + port_num}
 
         with patch("custom_components.exaviz.poe_readers.read_network_port_status", side_effect=mock_read), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
              patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", return_value=None):
             result = await read_all_onboard_ports([f"poe{i}" for i in range(8)])
 
@@ -276,15 +828,12 @@ class TestIntegrationScenarios:
 
     @pytest.mark.asyncio
     async def test_interceptor_two_addon_boards(self):
-        async def mock_read(pse_id, port_num):
-            return {
-                "available": True,
-                "enabled": port_num in [2, 4],
-                "state": "power on" if port_num in [2, 4] else "power off",
-                "power_watts": 15.5 if port_num in [2, 4] else 0.0,
-            }
-
-        with patch("custom_components.exaviz.poe_readers.read_pse_port_status", side_effect=mock_read), \
+        poe_readers._path_exists_cache.clear()
+        poe_readers._proc_pse_snapshot = None
+        poe_readers._proc_pse_lock = None
+        with patch("pathlib.Path.exists", return_value=True), \
+             patch("asyncio.to_thread", return_value=_proc_pse_text({0: {2, 4}, 1: {2, 4}})), \
+             patch("custom_components.exaviz.poe_readers.load_arp_table", return_value={}), \
              patch("custom_components.exaviz.poe_readers._get_connected_device_from_arp", return_value=None):
             pse0 = await read_all_addon_ports("pse0", port_count=8)
             pse1 = await read_all_addon_ports("pse1", port_count=8)
@@ -202,3 +202,71 @@ class TestVersionAlignment:
         # must track the manifest too.
         from custom_components.exaviz.const import PLUGIN_VERSION
         assert manifest["version"] == PLUGIN_VERSION
+
+
+# ---------------------------------------------------------------------------
+# 8. Port services map sensor entities to their port's switch (services.py)
+# ---------------------------------------------------------------------------
+
+class TestControlPortEntityMapping:
+    """binary_sensor.* used to become binary_switch.* via sensor. → switch."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("entity_id,expected", [
+        ("switch.onboard_port0", "switch.onboard_port0"),
+        ("sensor.onboard_port0_current", "switch.onboard_port0"),
+        ("binary_sensor.addon_0_port3_powered", "switch.addon_0_port3"),
+        ("binary_sensor.addon_1_port5_plug", "switch.addon_1_port5"),
+    ])
+    async def test_control_targets_switch(self, entity_id, expected):
+        from custom_components.exaviz.services import _control_poe_port
+
+        hass = Mock()
+        hass.services.async_call = AsyncMock()
+        await _control_poe_port(hass, entity_id, "turn_on")
+
+        hass.services.async_call.assert_awaited_once_with(
+            "switch", "turn_on", {"entity_id": expected}, blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("entity_id", [
+        "switch.addon_0_port3", "sensor.addon_0_port3_current",
+    ])
+    async def test_reset_presses_port_button(self, entity_id):
+        from custom_components.exaviz.services import async_setup_services
+
+        hass = Mock()
+        hass.services.async_call = AsyncMock()
+        await async_setup_services(hass)
+        handlers = {c.args[1]: c.args[2] for c in hass.services.async_register.call_args_list}
+        await handlers["reset_port"](Mock(data={"entity_id": entity_id}))
+
+        hass.services.async_call.assert_awaited_once_with(
+            "button", "press", {"entity_id": "button.addon_0_port3_reset"}, blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("service,data,action", [
+        ("turn_off_port", {}, "turn_off"),
+        ("toggle_port", {}, "toggle"),
+        ("control_port", {"action": "turn_on"}, "turn_on"),
+        ("control_port", {}, "toggle"),
+    ])
+    async def test_port_action_services(self, service, data, action):
+        from custom_components.exaviz.services import (
+            async_setup_services, async_unload_services,
+        )
+
+        hass = Mock()
+        hass.services.async_call = AsyncMock()
+        await async_setup_services(hass)
+        handlers = {c.args[1]: c.args[2] for c in hass.services.async_register.call_args_list}
+        await handlers[service](Mock(data={"entity_id": "switch.onboard_port2", **data}))
+        await async_unload_services(hass)
+
+        hass.services.async_call.assert_awaited_once_with(
+            "switch", action, {"entity_id": "switch.onboard_port2"}, blocking=True,
+        )
+        removed = {c.args[1] for c in hass.services.async_remove.call_args_list}
+        assert removed == set(handlers) and len(handlers) == 6
@@ -67,6 +67,35 @@ class TestMulticastMac:
         assert not _is_multicast_mac("nope")
 
 
+class TestLocalMacs:
+
+    def test_reads_each_interface_address(self, tmp_path):
+        for name, mac in (("eth0", "D8:3A:DD:00:00:01\n"), ("br0", "d8:3a:dd:00:00:02\n")):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "address").write_text(mac)
+        (tmp_path / "sit0").mkdir()  # no address file
+
+        real_scandir = poe_readers.os.scandir
+        with patch.object(poe_readers.os, "scandir", lambda _path: real_scandir(tmp_path)):
+            macs = poe_readers._read_local_macs()
+
+        assert macs == {"d8:3a:dd:00:00:01", "d8:3a:dd:00:00:02"}
+
+
+class TestBridgeMaster:
+
+    @pytest.mark.asyncio
+    async def test_master_link_gives_bridge_name(self):
+        with patch.object(poe_readers.os, "readlink", return_value="../../../devices/virtual/net/br0") as readlink:
+            assert await poe_readers._get_bridge_master("poe3") == "br0"
+        readlink.assert_called_once_with("/sys/class/net/poe3/master")
+
+    @pytest.mark.asyncio
+    async def test_no_master_link(self):
+        with patch.object(poe_readers.os, "readlink", side_effect=FileNotFoundError):
+            assert await poe_readers._get_bridge_master("poe3") is None
+
+
 class TestParseBridgeFdb:
     def test_extracts_learned_device(self):
         assert _parse_bridge_fdb(FDB_ONE_DEVICE, set()) == ["24:52:6a:08:71:80"]
@@ -3,18 +3,33 @@
 Covers: tcpdump dependency, broadcast detection, timeout handling,
 and device identification fallback chain (ARP → tcpdump → Unknown).
 """
+import socket
+import struct
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
+from custom_components.exaviz import poe_readers
 from custom_components.exaviz.poe_readers import (
     _detect_bosch_camera,
     _get_connected_device_from_arp,
+    load_arp_table,
+    _try_bosch_detection,
 )
 
 
 class TestBoschDetection:
     """Bosch camera detection via tcpdump packet capture."""
 
+    def setup_method(self):
+        poe_readers._bosch_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def _no_raw_socket(self):
+        """Force the tcpdump fallback, as on a non-root install."""
+        with patch.object(poe_readers, "_read_bosch_frames", side_effect=PermissionError):
+            yield
+
     @pytest.mark.asyncio
     async def test_tcpdump_not_installed(self):
         """Fails gracefully when tcpdump is missing."""
@@ -64,14 +79,176 @@ class TestBoschDetection:
         with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
             assert await _detect_bosch_camera("poe6") is None
 
+    @pytest.mark.asyncio
+    async def test_ascii_capture_with_snaplen(self):
+        ascii_output = (
+            b"01:23:45.678901 00:01:31:12:34:56 > ff:ff:ff:ff:ff:ff, ethertype 0x2070, length 128:\n"
+            b"..........Bosch.DINION IP 3000i\n"
+        )
+        mock_proc = AsyncMock()
+        mock_proc.communicate.return_value = (ascii_output, b"")
+        mock_proc.returncode = 0
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
+            result = await _detect_bosch_camera("poe6")
+
+        argv = mock_exec.call_args[0]
+        assert "-A" in argv and "-XX" not in argv
+        assert argv[argv.index("-s") + 1] == "256"
+        assert result["model"] == "DINION IP 3000i"
+
+    @pytest.mark.asyncio
+    async def test_negative_result_cached_per_mac(self):
+        """A non-Bosch device is not re-captured until its MAC changes."""
+        mock_proc = AsyncMock()
+        mock_proc.communicate.return_value = (b"", b"")
+        mock_proc.returncode = 124
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
+            assert await _detect_bosch_camera("poe6", "00:11:22:33:44:55") is None
+            assert await _detect_bosch_camera("poe6", "00:11:22:33:44:55") is None
+            assert mock_exec.call_count == 1
+
+            assert await _detect_bosch_camera("poe6", "66:77:88:99:aa:bb") is None
+            assert mock_exec.call_count == 2
+        assert ("poe6", "00:11:22:33:44:55") not in poe_readers._bosch_cache
+
+    @pytest.mark.asyncio
+    async def test_negative_result_expires(self):
+        mock_proc = AsyncMock()
+        mock_proc.communicate.return_value = (b"", b"")
+        mock_proc.returncode = 124
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
+            await _detect_bosch_camera("poe6")
+            poe_readers._bosch_cache[("poe6", None)] = (0.0, None)
+            await _detect_bosch_camera("poe6")
+        assert mock_exec.call_count == 2
+
+
+class TestRawSocketCapture:
+    """Bosch detection from raw AF_PACKET frames."""
+
+    def setup_method(self):
+        poe_readers._bosch_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_raw_frame_detected_without_tcpdump(self):
+        frame = b"\xff" * 6 + b"\x00\x01\x31\x12\x34\x56" + b"\x20\x70" + b"Bosch\x00FLEXIDOME IP 5000i\x00"
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=frame), \
+             patch("asyncio.create_subprocess_exec") as mock_exec:
+            result = await _detect_bosch_camera("poe6")
+
+        mock_exec.assert_not_called()
+        assert result["manufacturer"] == "Bosch Security Systems"
+        assert result["model"].startswith("FLEXIDOME IP 5000i")
+
+    @pytest.mark.asyncio
+    async def test_model_prefix_priority_and_text_run(self):
+        """FLEXIDOME wins over an earlier MIC hit; model text ends at non-printables."""
+        frame = b"Bosch\x00MIC IP fusion\x00FLEXIDOME panoramic 5100i\x00\x7f"
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=frame):
+            result = await _detect_bosch_camera("poe6")
+
+        assert result["model"] == "FLEXIDOME panoramic 5100i"
+
+    @pytest.mark.asyncio
+    async def test_no_frames_returns_none(self):
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=b""), \
+             patch("asyncio.create_subprocess_exec") as mock_exec:
+            assert await _detect_bosch_camera("poe6") is None
+        mock_exec.assert_not_called()
+
+
+class TestBoschTrafficGate:
+    """No-ARP ports are probed only when new traffic shows up."""
+
+    def setup_method(self):
+        poe_readers._last_traffic_seen.clear()
+        poe_readers._bosch_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_quiet_link_probed_once(self):
+        with patch.object(poe_readers, "_detect_bosch_camera", AsyncMock(return_value=None)) as detect:
+            await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+            await _try_bosch_detection("poe6", "up", 50_100, 2_000, None)
+            assert detect.await_count == 1
+
+            await _try_bosch_detection("poe6", "up", 80_000, 2_000, None)
+            assert detect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_counter_reset_counts_as_new_traffic(self):
+        with patch.object(poe_readers, "_detect_bosch_camera", AsyncMock(return_value=None)) as detect:
+            await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+            await _try_bosch_detection("poe6", "up", 5_000, 0, None)
+        assert detect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_quiet_poll_keeps_detected_camera(self):
+        frame = b"Bosch\x00FLEXIDOME IP 5000i\x00"
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=frame) as capture:
+            first = await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+            second = await _try_bosch_detection("poe6", "up", 50_100, 2_000, None)
+
+        assert capture.call_count == 1
+        assert first["model"].startswith("FLEXIDOME")
+        assert second is not None
+        assert second["model"] == first["model"]
+
+    @pytest.mark.asyncio
+    async def test_positive_expires_and_is_reconfirmed(self):
+        frame = b"Bosch\x00FLEXIDOME IP 5000i\x00"
+        with patch.object(poe_readers, "_read_bosch_frames", side_effect=[frame, b""]) as capture, \
+             patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError):
+            await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+            expiry, _ = poe_readers._bosch_cache[("poe6", None)]
+            assert expiry < float("inf")
+
+            with patch("time.monotonic", return_value=expiry + 1):
+                result = await _try_bosch_detection("poe6", "up", 50_100, 2_000, None)
+
+        assert capture.call_count == 2
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_link_down_forgets_camera(self):
+        frame = b"Bosch\x00FLEXIDOME IP 5000i\x00"
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=frame):
+            await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+        assert poe_readers._bosch_cache
+
+        await _try_bosch_detection("poe6", "down", 50_000, 2_000, None)
+        assert not poe_readers._bosch_cache
+
+    @pytest.mark.asyncio
+    async def test_counter_reset_forgets_camera(self):
+        frame = b"Bosch\x00FLEXIDOME IP 5000i\x00"
+        with patch.object(poe_readers, "_read_bosch_frames", return_value=frame):
+            await _try_bosch_detection("poe6", "up", 50_000, 2_000, None)
+        with patch.object(poe_readers, "_detect_bosch_camera", AsyncMock(return_value=None)) as detect:
+            result = await _try_bosch_detection("poe6", "up", 5_000, 0, None)
+
+        assert detect.await_count == 1
+        assert result is None
+        assert not poe_readers._bosch_cache
+
 
 class TestARPDeviceDetection:
     """Device detection from the ARP table."""
 
+    def setup_method(self):
+        poe_readers._enrich_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def _no_netlink(self):
+        """Force the `ip neigh show` fallback."""
+        with patch.object(poe_readers, "_dump_neighbours", side_effect=OSError):
+            yield
+
     @pytest.mark.asyncio
     async def test_device_found_in_arp(self):
-        # ip neigh show dev poe0 → output omits "dev poeX"
-        arp_output = b"192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE\n"
+        arp_output = b"192.168.1.100 dev poe0 lladdr 00:11:22:33:44:55 REACHABLE\n"
         mock_proc = AsyncMock()
         mock_proc.communicate.return_value = (arp_output, b"")
         mock_proc.returncode = 0
@@ -110,3 +287,173 @@ class TestARPDeviceDetection:
         with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
             result = await _get_connected_device_from_arp("poe0")
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_ipv4_preferred_over_earlier_ipv6(self):
+        snapshot = {"poe3": (
+            "fe80::2652:6aff:fe08:7180 lladdr 24:52:6a:08:71:80 STALE\n"
+            "192.168.86.93 lladdr 24:52:6a:08:71:80 used 0/0/0 probes 4 STALE"
+        )}
+        with patch("custom_components.exaviz.poe_readers.enrich_device_info",
+                   side_effect=lambda info: info):
+            result = await _get_connected_device_from_arp("poe3", snapshot)
+        assert result["ip_address"] == "192.168.86.93"
+        assert result["arp_state"] == "STALE"
+
+    @pytest.mark.asyncio
+    async def test_reachable_neighbour_preferred_over_stale(self):
+        snapshot = {"poe3": (
+            "192.168.86.40 lladdr 24:52:6a:08:71:01 STALE\n"
+            "192.168.86.93 lladdr 24:52:6a:08:71:80 REACHABLE"
+        )}
+        with patch("custom_components.exaviz.poe_readers.enrich_device_info",
+                   side_effect=lambda info: info):
+            result = await _get_connected_device_from_arp("poe3", snapshot)
+        assert result["ip_address"] == "192.168.86.93"
+        assert result["arp_state"] == "REACHABLE"
+
+    @pytest.mark.asyncio
+    async def test_ipv6_only_neighbour(self):
+        snapshot = {"poe3": "fe80::2652:6aff:fe08:7180 lladdr 24:52:6a:08:71:80 REACHABLE"}
+        with patch("custom_components.exaviz.poe_readers.enrich_device_info",
+                   side_effect=lambda info: info):
+            result = await _get_connected_device_from_arp("poe3", snapshot)
+        assert result["ip_address"] == "fe80::2652:6aff:fe08:7180"
+        assert result["mac_address"] == "24:52:6a:08:71:80"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_lookup_spawns_nothing(self):
+        snapshot = {"poe0": "192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE"}
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec, \
+             patch("custom_components.exaviz.poe_readers.enrich_device_info",
+                   side_effect=lambda info: info):
+            found = await _get_connected_device_from_arp("poe0", snapshot)
+            missing = await _get_connected_device_from_arp("poe1", snapshot)
+
+        mock_exec.assert_not_called()
+        assert found["mac_address"] == "00:11:22:33:44:55"
+        assert missing is None
+
+    @pytest.mark.asyncio
+    async def test_enrichment_reused_until_ip_changes(self):
+        enrich = AsyncMock(side_effect=lambda info: {**info, "manufacturer": "Axis", "hostname": "cam"})
+        first = {"poe0": "192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE"}
+        moved = {"poe0": "192.168.1.101 lladdr 00:11:22:33:44:55 REACHABLE"}
+
+        with patch("custom_components.exaviz.poe_readers.enrich_device_info", enrich):
+            a = await _get_connected_device_from_arp("poe0", first)
+            b = await _get_connected_device_from_arp("poe0", first)
+            assert enrich.await_count == 1
+            await _get_connected_device_from_arp("poe0", moved)
+            assert enrich.await_count == 2
+
+        assert a == b and a is not b
+        assert b["hostname"] == "cam"
+        assert len(poe_readers._enrich_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_vcs_device_confirmed_as_bosch_once(self):
+        snapshot = {"poe6": (
+            "192.168.1.50 lladdr 00:07:5f:12:34:56 REACHABLE\n"
+            "fe80::207:5fff:fe12:3456 lladdr 00:07:5f:12:34:56 STALE"
+        )}
+        detect = AsyncMock(return_value={"model": "FLEXIDOME 5100i"})
+        with patch("custom_components.exaviz.poe_readers.enrich_device_info",
+                   AsyncMock(side_effect=lambda info: {**info, "manufacturer": "VCS Video Communication Systems AG"})), \
+             patch.object(poe_readers, "_detect_bosch_camera", detect):
+            result = await _get_connected_device_from_arp("poe6", snapshot)
+
+        detect.assert_awaited_once_with("poe6", "00:07:5f:12:34:56")
+        assert result["manufacturer"] == "Bosch"
+        assert result["model"] == "FLEXIDOME 5100i"
+
+
+def _neigh_message(ifindex, dst, lladdr, state, family=socket.AF_INET):
+    """One RTM_NEWNEIGH netlink message as the kernel sends it."""
+    attrs = b""
+    for attr_type, value in ((1, dst), (2, lladdr)):
+        if value is not None:
+            attr = struct.pack("=HH", 4 + len(value), attr_type) + value
+            attrs += attr + b"\0" * (-len(attr) % 4)
+    body = struct.pack("=BxxxiHBB", family, ifindex, state, 0, 0) + attrs
+    return struct.pack("=IHHII", 16 + len(body), 28, 2, 1, 0) + body
+
+
+class TestNetlinkNeighbours:
+    """Neighbour table read over rtnetlink."""
+
+    def test_renders_entries_like_ip_neigh(self):
+        names = {3: "poe0", 4: "poe3"}
+        data = (
+            _neigh_message(3, bytes([192, 168, 1, 100]), bytes.fromhex("001122334455"), 0x02)
+            + _neigh_message(4, socket.inet_pton(socket.AF_INET6, "fe80::2652:6aff:fe08:7180"),
+                             bytes.fromhex("24526a087180"), 0x04, socket.AF_INET6)
+            + _neigh_message(4, bytes([10, 0, 0, 1]), None, 0x20)
+        )
+        table = {}
+        assert poe_readers._parse_neigh_messages(data, names, table) is False
+        assert table == {
+            "poe0": ["192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE"],
+            "poe3": ["fe80::2652:6aff:fe08:7180 lladdr 24:52:6a:08:71:80 STALE",
+                     "10.0.0.1 FAILED"],
+        }
+
+    def test_skips_noarp_and_unknown_interfaces(self):
+        data = (
+            _neigh_message(1, bytes([0, 0, 0, 0]), bytes(6), 0x40)
+            + _neigh_message(9, bytes([10, 0, 0, 2]), bytes(6), 0x02)
+        )
+        table = {}
+        poe_readers._parse_neigh_messages(data, {1: "lo"}, table)
+        assert table == {}
+
+    def test_done_and_error_messages(self):
+        done = struct.pack("=IHHII", 20, 3, 2, 1, 0) + b"\0" * 4
+        assert poe_readers._parse_neigh_messages(done, {}, {}) is True
+        error = struct.pack("=IHHIIi", 20, 2, 0, 1, 0, -1)
+        with pytest.raises(OSError):
+            poe_readers._parse_neigh_messages(error, {}, {})
+
+    @pytest.mark.asyncio
+    async def test_load_arp_table_uses_netlink(self):
+        with patch.object(poe_readers, "_dump_neighbours",
+                          return_value={"poe0": "192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE"}), \
+             patch("asyncio.create_subprocess_exec") as mock_exec:
+            table = await load_arp_table()
+        mock_exec.assert_not_called()
+        assert table["poe0"].startswith("192.168.1.100")
+
+
+class TestLoadArpTable:
+    """One `ip neigh show` grouped by interface, when netlink is unusable."""
+
+    @pytest.fixture(autouse=True)
+    def _no_netlink(self):
+        with patch.object(poe_readers, "_dump_neighbours", side_effect=OSError):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_groups_by_dev_and_strips_dev_field(self):
+        neigh_output = (
+            b"192.168.1.100 dev poe0 lladdr 00:11:22:33:44:55 REACHABLE\n"
+            b"192.168.86.93 dev poe3 lladdr 24:52:6a:08:71:80 used 0/0/0 probes 4 STALE\n"
+            b"fe80::2652:6aff:fe08:7180 dev poe3 lladdr 24:52:6a:08:71:80 STALE\n"
+            b"10.0.0.1 dev eth0 FAILED\n"
+        )
+        mock_proc = AsyncMock()
+        mock_proc.communicate.return_value = (neigh_output, b"")
+        mock_proc.returncode = 0
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
+            table = await load_arp_table()
+
+        assert mock_exec.call_count == 1
+        assert table["poe0"] == "192.168.1.100 lladdr 00:11:22:33:44:55 REACHABLE"
+        assert table["poe3"].splitlines()[1].startswith("fe80::2652:6aff:fe08:7180 lladdr")
+        assert table["eth0"] == "10.0.0.1 FAILED"
+
+    @pytest.mark.asyncio
+    async def test_command_failure_returns_empty(self):
+        with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError("ip")):
+            assert await load_arp_table() == {}